@@ -0,0 +1,142 @@
+import asyncio
+import collections
+import io
+import struct
+
+import pytest
+
+pytest.importorskip("serial")
+
+from kflash import (AsyncMAIXLoader, FlashPlan, FlashRegion, SessionMetrics, WireCapture, WireReplay,  # noqa: E402
+                    async_flash)
+
+STUB = bytes(range(256)) * 6  # two stub frames
+FIRMWARE = bytes(range(251)) * 600  # three flash frames
+
+
+class IspPort:
+    """Port stand-in for a K210 boot ROM and flash stub: acks every request, keeps the flashed frames."""
+
+    ACKED = (0xC2, 0xC3, 0xD2, 0xD7, 0xD4)
+
+    def __init__(self):
+        self.port = "/dev/ttyTEST0"
+        self.baudrate = 115200
+        self.flash = {}
+        self._in = b""
+        self._out = collections.deque()
+
+    def write(self, data):
+        self._in += bytes(data)
+        while True:
+            start = self._in.find(b"\xc0")
+            end = self._in.find(b"\xc0", start + 1)
+            if start < 0 or end < 0:
+                return len(data)
+            frame = self._in[start + 1:end].replace(b"\xdb\xdc", b"\xc0").replace(b"\xdb\xdd", b"\xdb")
+            self._in = self._in[end:] if not frame else self._in[end + 1:]
+            if frame and frame[0] in self.ACKED:
+                if frame[0] == 0xD4:
+                    address, length = struct.unpack("II", frame[8:16])
+                    self.flash[address] = frame[16:16 + length]
+                self._out.extend(b"\xc0" + bytes([frame[0], 0xE0]) + b"\xc0")
+
+    def read(self, size=1):
+        return bytes(self._out.popleft() for _ in range(min(size, len(self._out))))
+
+    def inWaiting(self):
+        return len(self._out)
+
+    def setDTR(self, value=True):
+        pass
+
+    def setRTS(self, value=True):
+        pass
+
+    def flushInput(self):
+        self._out.clear()
+
+    def flushOutput(self):
+        pass
+
+    def close(self):
+        pass
+
+
+def plan():
+    return FlashPlan([FlashRegion(0, io.BytesIO(FIRMWARE), len(FIRMWARE), name="firmware.bin")])
+
+
+def flash(port, **kwargs):
+    metrics = SessionMetrics()
+    result = asyncio.run(async_flash(port, plan(), board="dan", baudrate=1500000, stub=STUB,
+                                     metrics=metrics, log=lambda *args: None, **kwargs))
+    return result, metrics
+
+
+@pytest.fixture(scope="module")
+def capture(tmp_path_factory):
+    path = str(tmp_path_factory.mktemp("wire") / "session.kfcap")
+    device = IspPort()
+    result, _ = flash(WireCapture(device, path))
+    return path, device, result
+
+
+def test_session_against_the_device(capture):
+    _, device, result = capture
+
+    assert result["ok"] is True
+    frames = b"".join(device.flash[address] for address in sorted(device.flash))
+    expected = list(plan().frames())
+    assert sorted(device.flash) == [address for address, _ in expected]
+    assert frames == b"".join(data for _, data in expected)
+
+
+def test_replay_of_the_capture(capture):
+    path, _, recorded = capture
+    replay = WireReplay(path, time_scale=0)
+    progress = []
+
+    result, metrics = flash(replay, progress=lambda label, percent, suffix: progress.append(percent))
+
+    assert result["ok"] is True
+    assert replay.mismatches == 0
+    assert result["info"]["frames"] == recorded["info"]["frames"] == 3
+    assert progress[-1] == 100.0
+    assert not metrics.retries
+
+
+def test_replay_flags_a_different_image(capture):
+    path, _, _ = capture
+    replay = WireReplay(path, time_scale=0)
+    other = FlashPlan([FlashRegion(0, io.BytesIO(FIRMWARE[::-1]), len(FIRMWARE), name="other.bin")])
+
+    result = asyncio.run(async_flash(replay, other, board="dan", baudrate=1500000, stub=STUB, log=lambda *args: None))
+
+    assert result["ok"] is True
+    assert replay.mismatches == 3
+
+
+def test_cancel_aborts_the_port(capture):
+    path, _, _ = capture
+    replay = WireReplay(path, time_scale=1.0)
+    metrics = SessionMetrics()
+
+    async def cancel_soon():
+        task = asyncio.ensure_future(async_flash(replay, plan(), board="dan", stub=STUB, metrics=metrics,
+                                                 log=lambda *args: None))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(cancel_soon())
+
+    assert metrics.error == "Cancel"
+    assert not replay.isOpen()
+
+
+def test_board_aliases_and_unknown_boards():
+    assert AsyncMAIXLoader(None, board="maixduino").board == "goE"
+    with pytest.raises(ValueError):
+        AsyncMAIXLoader(None, board="nope")
@@ -0,0 +1,154 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("flask")
+pytest.importorskip("serial")
+
+import web_flasher  # noqa: E402
+from kflash import FlashCancelled, KFlash  # noqa: E402
+from web_flasher import FlashExecutor, FlashJob, FlashLoop, FlashQueueFull  # noqa: E402
+
+
+class Board:
+    """Job targets that hold a port until released and record what ran at the same time."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.running = set()
+        self.overlaps = []
+        self.release = threading.Event()
+
+    def target(self, job):
+        with self.lock:
+            self.running.add(job.id)
+            self.overlaps.append(set(self.running))
+        try:
+            self.release.wait(5)
+        finally:
+            with self.lock:
+                self.running.discard(job.id)
+
+    def job(self, port, name):
+        return FlashJob(port, self.target, job_id=name)
+
+
+def wait_for(condition, timeout=5):
+    deadline = time.time() + timeout
+    while not condition():
+        assert time.time() < deadline, "timed out"
+        time.sleep(0.01)
+
+
+def test_ports_run_in_parallel_and_jobs_of_a_port_in_order():
+    board = Board()
+    executor = FlashExecutor(max_workers=2, max_queued=8, max_per_port=3)
+    jobs = [executor.submit(board.job(port, f"{port}-{n}")) for n in range(2) for port in ("/dev/a", "/dev/b", "/dev/c")]
+
+    wait_for(lambda: len(board.running) == 2)
+    assert board.running == {"/dev/a-0", "/dev/b-0"}
+    board.release.set()
+    for job in jobs:
+        assert job.done.wait(5)
+
+    assert all(job.state == "done" for job in jobs)
+    assert max(len(running) for running in board.overlaps) == 2
+    for running in board.overlaps:
+        assert len({job_id.split("-")[0] for job_id in running}) == len(running)
+    assert not executor.busy()
+
+
+def test_queue_limits():
+    board = Board()
+    executor = FlashExecutor(max_workers=1, max_queued=3, max_per_port=2)
+    executor.submit(board.job("/dev/a", "running"))
+    wait_for(lambda: board.running)
+    executor.submit(board.job("/dev/a", "a1"))
+    executor.submit(board.job("/dev/a", "a2"))
+
+    with pytest.raises(FlashQueueFull):
+        executor.submit(board.job("/dev/a", "a3"))
+    executor.submit(board.job("/dev/b", "b1"))
+    with pytest.raises(FlashQueueFull):
+        executor.submit(board.job("/dev/c", "c1"))
+    with pytest.raises(ValueError):
+        executor.submit(board.job("/dev/b", "b1"))
+    board.release.set()
+
+
+def test_full_queue_is_refused_with_429(monkeypatch):
+    board = Board()
+    executor = FlashExecutor(max_workers=1, max_queued=1, max_per_port=1)
+    monkeypatch.setattr(web_flasher, "flash_executor", executor)
+    executor.submit(board.job("/dev/a", "running"))
+    wait_for(lambda: board.running)
+    executor.submit(board.job("/dev/a", "queued"))
+
+    with web_flasher.app.app_context():
+        response, status = web_flasher.enqueue_flash(board.job("/dev/b", "refused"))
+
+    assert status == 429
+    assert response.get_json()["success"] is False
+    board.release.set()
+
+
+def test_cancel_a_queued_job():
+    board = Board()
+    executor = FlashExecutor(max_workers=1)
+    running = executor.submit(board.job("/dev/a", "running"))
+    wait_for(lambda: board.running)
+    queued = executor.submit(board.job("/dev/a", "queued"))
+
+    assert executor.cancel("queued") is queued
+    board.release.set()
+    assert running.done.wait(5)
+
+    assert queued.state == "cancelled"
+    assert "queued" not in {job_id for running in board.overlaps for job_id in running}
+    assert running.state == "done"
+
+
+def test_auto_detect_jobs_run_alone():
+    board = Board()
+    executor = FlashExecutor(max_workers=4)
+    first = executor.submit(board.job("/dev/a", "a"))
+    wait_for(lambda: board.running)
+    auto = executor.submit(board.job(FlashExecutor.AUTO_PORT, "auto"))
+    later = executor.submit(board.job("/dev/b", "b"))
+
+    time.sleep(0.1)
+    assert board.running == {"a"}
+    board.release.set()
+    for job in (first, auto, later):
+        assert job.done.wait(5)
+
+    assert {"auto"} in board.overlaps
+    assert not any("auto" in running and len(running) > 1 for running in board.overlaps)
+
+
+def test_cancel_a_running_async_job():
+    started = threading.Event()
+
+    async def target(job):
+        started.set()
+        await asyncio.sleep(5)
+
+    executor = FlashExecutor(loop=FlashLoop())
+    job = executor.submit(FlashJob("/dev/a", target, job_id="async"))
+    assert started.wait(5)
+
+    executor.cancel("async")
+
+    assert job.done.wait(1)
+    assert job.state == "cancelled"
+
+
+def test_kill_before_the_session_starts_cancels_it():
+    kf = KFlash(print_callback=lambda *args, **kwargs: None)
+    kf.kill()
+
+    with pytest.raises(FlashCancelled):
+        kf.process(terminal=False, dev="/dev/ttyTEST0", file="missing.bin", noansi=True)
+    assert kf.metrics.error == "Cancel"
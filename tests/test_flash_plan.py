@@ -0,0 +1,193 @@
+import hashlib
+import io
+import json
+import struct
+import threading
+import time
+import zipfile
+
+import pytest
+
+pytest.importorskip("serial")
+
+import kflash  # noqa: E402
+from kflash import FlashPlan, FlashRegion, build_flash_plan  # noqa: E402
+
+
+def image(data, sha256_prefix=True):
+    """The bytes kflash programs for data: AES flag, size, data and sha256 trailer."""
+    if not sha256_prefix:
+        return data
+    body = b"\x00" + struct.pack("I", len(data)) + data
+    return body + hashlib.sha256(body).digest()
+
+
+def write_kfpkg(path, files, members):
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr("flash-list.json", json.dumps({"version": "0.1.0", "files": files}))
+        for name, data in members.items():
+            zf.writestr(name, data)
+    return str(path)
+
+
+def flash_bytes(plan):
+    """Flash contents programmed by the plan, {address: byte string} per contiguous run."""
+    runs = {}
+    for address, data in plan.frames():
+        for start, run in runs.items():
+            if start + len(run) == address:
+                runs[start] = run + data
+                break
+        else:
+            runs[address] = data
+    return runs
+
+
+@pytest.fixture(autouse=True)
+def empty_plan_cache():
+    kflash._prepared_plan_cache.clear()
+    yield
+    kflash._prepared_plan_cache.clear()
+
+
+def test_kfpkg_members_are_read_from_the_zip(tmp_path):
+    a, b = b"a" * 5000, b"b" * 70000
+    path = write_kfpkg(tmp_path / "fw.kfpkg",
+                       [{"address": 0, "bin": "a.bin", "sha256Prefix": True},
+                        {"address": "0x100000", "bin": "b.bin", "sha256Prefix": False}],
+                       {"a.bin": a, "b.bin": b})
+
+    with open(path, "rb") as f:
+        from_stream = flash_bytes(build_flash_plan([(io.BytesIO(f.read()), 0, True, "fw.kfpkg")]))
+    runs = flash_bytes(build_flash_plan([(path, 0, True)]))
+
+    assert runs == from_stream
+    assert runs[0].startswith(image(a))
+    assert runs[0x100000][:len(b)] == b
+    assert len(runs[0x100000]) % 4096 == 0
+
+
+def test_kfpkg_missing_member(tmp_path):
+    path = write_kfpkg(tmp_path / "fw.kfpkg", [{"address": 0, "bin": "a.bin"}], {})
+
+    with pytest.raises(ValueError, match="a.bin"):
+        build_flash_plan([(path, 0, True)])
+
+
+def test_prepared_plans_are_cached_by_content(tmp_path):
+    first = tmp_path / "a.bin"
+    first.write_bytes(b"x" * 1000)
+    copy = tmp_path / "b.bin"
+    copy.write_bytes(b"x" * 1000)
+
+    plan = build_flash_plan([(str(first), 0, False)])
+
+    assert build_flash_plan([(str(copy), 0, False)]) is plan
+    assert flash_bytes(plan)[0].startswith(image(b"x" * 1000))
+    # a cached plan can be sent again
+    assert flash_bytes(plan) == flash_bytes(build_flash_plan([(str(first), 0, False)]))
+
+
+def test_plan_cache_is_bounded_by_bytes(tmp_path, monkeypatch):
+    monkeypatch.setattr(kflash, "_PREPARED_PLAN_MAX_BYTES", 3 * 65536)
+    paths = []
+    for n in range(3):
+        path = tmp_path / f"{n}.bin"
+        path.write_bytes(bytes([n]) * 65536)  # two frames with the header and trailer
+        paths.append(str(path))
+
+    plans = [build_flash_plan([(path, 0, False)]) for path in paths]
+
+    cached = list(kflash._prepared_plan_cache.values())
+    assert plans[0].prepared_bytes == 65536 + 4096
+    assert cached == plans[1:]
+    assert sum(p.prepared_bytes for p in cached) <= 3 * 65536
+
+
+
+def region(address, data, name, sha256_prefix=True):
+    return FlashRegion(address, io.BytesIO(data), len(data), sha256_prefix, name=name)
+
+
+def test_nearby_regions_share_frames():
+    a, b = b"a" * 1000, b"b" * 2000
+    plan = FlashPlan([region(0x8000, b, "b"), region(0, a, "a")])
+
+    frames = list(plan.frames())
+
+    assert [r.name for r in plan.regions] == ["a", "b"]
+    assert len(plan.groups) == 1
+    assert (plan.total_frames, plan.unmerged_frames) == (1, 2)
+    assert len(frames) == 1
+    # zero filled gap after a, then b padded to a whole sector
+    expected = image(a) + b"\x00" * (0x8000 - len(image(a))) + image(b)
+    assert frames[0] == (0, expected + b"\x00" * (-len(expected) % 4096))
+
+
+def test_frames_of_a_region_after_a_frame_boundary():
+    a, b = b"a" * 1000, b"b" * 2000
+    plan = FlashPlan([region(0, a, "a"), region(0x10000, b, "b")])
+
+    assert len(plan.groups) == 2
+    assert [(address, len(data)) for address, data in plan.frames()] == [(0, 4096), (0x10000, 4096)]
+
+
+def test_small_regions_in_one_frame():
+    blobs = [region(n * 4096, bytes([n + 1]) * 100, f"r{n}", sha256_prefix=False) for n in range(4)]
+    plan = FlashPlan(blobs)
+
+    frames = list(plan.frames())
+
+    assert (plan.total_frames, plan.unmerged_frames) == (1, 4)
+    assert len(frames) == 1 and len(frames[0][1]) == 4 * 4096
+    for n in range(4):
+        assert frames[0][1][n * 4096:n * 4096 + 100] == bytes([n + 1]) * 100
+        assert frames[0][1][n * 4096 + 100:(n + 1) * 4096] == b"\x00" * 3996
+
+
+def test_overlapping_regions():
+    with pytest.raises(ValueError, match="overlap"):
+        FlashPlan([region(0, b"a" * 5000, "a"), region(4096, b"b" * 10, "b")])
+
+
+def test_later_region_at_the_same_address_replaces():
+    first, second = region(0, b"old", "old"), region(0, b"new", "new")
+    plan = FlashPlan([first, second])
+
+    assert plan.replaced == [first]
+    assert plan.regions == [second]
+    assert list(plan.frames())[0][1].startswith(image(b"new"))
+
+
+def test_streams_are_sent_from_a_bounded_queue():
+    data = bytes(range(256)) * 4096 * 4  # 4 MiB, 65 frames
+    plan = build_flash_plan([(io.BytesIO(data), 0, False, "fw.bin")])
+    time.sleep(0.2)
+
+    assert plan.prepared_bytes == 0
+    assert plan._queue.qsize() == FlashPlan.PREPARE_AHEAD
+    assert flash_bytes(plan)[0].startswith(image(data))
+    with pytest.raises(ValueError):
+        plan.frames()
+
+
+def test_stream_errors_are_raised_by_frames():
+    plan = FlashPlan([FlashRegion(0, io.BytesIO(b"x" * 100), 200, name="short")]).prepare()
+
+    with pytest.raises(IOError, match="missing"):
+        list(plan.frames())
+
+
+def test_closing_an_unsent_plan_stops_building_frames(tmp_path):
+    path = write_kfpkg(tmp_path / "fw.kfpkg", [{"address": 0, "bin": "a.bin"}], {"a.bin": b"a" * (4 << 20)})
+    with open(path, "rb") as f:
+        stream = io.BytesIO(f.read())
+    plan = build_flash_plan([(stream, 0, True, "fw.kfpkg")])
+    threads = [t for t in threading.enumerate() if t.name == "kflash-frames"]
+    assert threads
+
+    plan.close()
+    for thread in threads:
+        thread.join(2)
+
+    assert not any(thread.is_alive() for thread in threads)
@@ -0,0 +1,103 @@
+import json
+
+import pytest
+
+pytest.importorskip("flask")
+pytest.importorskip("serial")
+
+from web_flasher import JobLog  # noqa: E402
+
+
+def bar(log, label, done, total, suffix=""):
+    """What KFlash.process() prints for one progress bar redraw."""
+    percent = "%.1f" % (100 * done / total)
+    filled = 10 * done // total
+    log.write("\r%s |%s| %s%% %s" % (label, "=" * filled + "-" * (10 - filled), percent, suffix), end="\r")
+    if done == total:
+        log.write()
+
+
+def test_progress_redraws_update_one_entry():
+    log = JobLog(limit=10)
+    log.write("\x1b[32m[INFO]\x1b[0m", "Trying to Enter the ISP Mode...")
+    for n in range(1, 101):
+        bar(log, "Programming BIN:", n, 100, "90kiB/s")
+    log.write("[WARN]", "Board unknown !! please press reset to boot!!")
+
+    entries = log.entries()
+
+    assert [entry["level"] for entry in entries] == ["info", "progress", "warn"]
+    assert entries[0]["msg"] == "[INFO] Trying to Enter the ISP Mode..."
+    assert entries[1]["label"] == "Programming BIN"
+    assert entries[1]["percent"] == 100.0 and entries[1]["suffix"] == "90kiB/s"
+    assert log.dropped == 0
+
+
+def test_a_new_bar_after_a_finished_one_is_a_new_entry():
+    log = JobLog(limit=10)
+    for _ in range(2):
+        for n in range(1, 5):
+            bar(log, "Downloading ISP:", n, 4)
+
+    assert [entry["label"] for entry in log.entries()] == ["Downloading ISP", "Downloading ISP"]
+
+
+def test_async_progress_events_fold_like_bars():
+    log = JobLog(limit=10)
+    for percent in (10, 50, 100):
+        log.progress("Programming BIN", percent, "1kiB/s")
+
+    entries = log.entries()
+
+    assert len(entries) == 1
+    assert entries[0]["percent"] == 100 and entries[0]["msg"] == "Programming BIN: 100.0% 1kiB/s"
+
+
+def test_ring_buffer_drops_the_oldest_lines():
+    log = JobLog(limit=5)
+    for n in range(12):
+        log.write("line", n)
+
+    assert log.lines() == ["line %d" % n for n in range(7, 12)]
+    assert log.dropped == 7
+    assert [entry["seq"] for entry in log.entries()] == list(range(8, 13))
+
+
+def test_progress_entry_comes_back_after_it_was_dropped():
+    log = JobLog(limit=3)
+    bar(log, "Programming BIN:", 1, 4)
+    for n in range(3):
+        log.write("line", n)
+    bar(log, "Programming BIN:", 2, 4)
+
+    entries = log.entries()
+
+    assert entries[-1]["level"] == "progress" and entries[-1]["percent"] == 50.0
+    assert log.dropped == 2
+
+
+def test_pieces_of_a_line_are_joined():
+    log = JobLog()
+    log.write(".", end="")
+    log.write(".", end="")
+    assert log.lines() == [".."]
+    log.write("done")
+
+    assert log.lines() == ["..done"]
+    assert len(log.entries()) == 1
+
+
+def test_finished_entries_are_spilled_to_the_file(tmp_path):
+    path = tmp_path / "job.jsonl"
+    log = JobLog(limit=2, path=str(path))
+    for n in range(5):
+        log.write("line", n)
+    for n in range(1, 5):
+        bar(log, "Programming BIN:", n, 4)
+    log.error("ERROR: boom")
+
+    records = [json.loads(line) for line in path.read_text().splitlines()]
+
+    assert [record["msg"] for record in records[:5]] == ["line %d" % n for n in range(5)]
+    assert records[5]["level"] == "progress" and records[5]["percent"] == 100.0
+    assert records[6]["level"] == "error"
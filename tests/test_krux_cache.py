@@ -0,0 +1,139 @@
+import errno
+import itertools
+import os
+import threading
+
+import pytest
+
+pytest.importorskip("flask")
+pytest.importorskip("serial")
+
+import web_flasher  # noqa: E402
+from web_flasher import KruxCache  # noqa: E402
+
+
+def _add_version(root, version, size):
+    with open(os.path.join(root, f"krux-{version}.zip"), "wb") as f:
+        f.write(os.urandom(size))
+
+
+def test_krux_cache_quota_evicts_least_recently_flashed(tmp_path, monkeypatch):
+    root = str(tmp_path)
+    cache = KruxCache(root, quota_bytes=0)
+    clock = itertools.count(1000)
+    monkeypatch.setattr(web_flasher.time, "time", lambda: next(clock))
+    for version in ("v1", "v2", "v3", "v4"):
+        _add_version(root, version, 10_000)
+        cache.touch(version)
+    cache.touch("v1")  # v2 is now the least recently flashed
+    cache.quota_bytes = cache.usage() - 15_000
+
+    with cache.pin("v3"):
+        evicted = cache.enforce_quota(keep=("v4",))
+
+    # v3 is pinned and v4 kept, so the next victim after v2 is v1 despite its recent flash
+    assert evicted == ["v2", "v1"]
+    assert cache.versions() == ["v3", "v4"]
+    assert cache.usage() <= cache.quota_bytes
+
+
+def test_krux_cache_quota_keeps_pinned_and_kept_versions(tmp_path):
+    root = str(tmp_path)
+    cache = KruxCache(root, quota_bytes=0)
+    for version in ("v1", "v2"):
+        _add_version(root, version, 10_000)
+        cache.touch(version)
+    cache.quota_bytes = 1
+
+    with cache.pin("v1"):
+        evicted = cache.enforce_quota(keep=("v2",))
+
+    assert evicted == []
+    assert cache.versions() == ["v1", "v2"]
+
+
+
+def _add_board(root, version, files):
+    board = os.path.join(root, f"krux-{version}", "maixpy_dock")
+    os.makedirs(board)
+    for name, data in files.items():
+        with open(os.path.join(board, name), "wb") as f:
+            f.write(data)
+    return board
+
+
+def test_dedupe_hardlinks_identical_files(tmp_path):
+    root = str(tmp_path)
+    cache = KruxCache(root, quota_bytes=0)
+    v1 = _add_board(root, "v1", {"kboot.kfpkg": b"same", "firmware.bin": b"one"})
+    v2 = _add_board(root, "v2", {"kboot.kfpkg": b"same", "firmware.bin": b"two"})
+
+    cache.dedupe(os.path.join(root, "krux-v1"))
+    cache.dedupe(os.path.join(root, "krux-v2"))
+
+    assert os.path.samefile(os.path.join(v1, "kboot.kfpkg"), os.path.join(v2, "kboot.kfpkg"))
+    assert not os.path.samefile(os.path.join(v1, "firmware.bin"), os.path.join(v2, "firmware.bin"))
+    cache.evict("v1")
+    with open(os.path.join(v2, "kboot.kfpkg"), "rb") as f:
+        assert f.read() == b"same"
+
+
+def test_dedupe_stops_without_hardlinks(tmp_path, monkeypatch):
+    root = str(tmp_path)
+    cache = KruxCache(root, quota_bytes=0)
+    board = _add_board(root, "v1", {"a": b"1", "b": b"2"})
+    calls = []
+
+    def no_links(src, dst):
+        calls.append(dst)
+        raise OSError(errno.EXDEV, "cross-device link")
+
+    monkeypatch.setattr(web_flasher.os, "link", no_links)
+    cache.dedupe(board)
+
+    assert len(calls) == 1
+
+
+def test_dedupe_skips_a_file_it_cannot_replace(tmp_path, monkeypatch):
+    root = str(tmp_path)
+    cache = KruxCache(root, quota_bytes=0)
+    first = _add_board(root, "v1", {"a": b"x", "b": b"x", "c": b"x"})
+    cache.dedupe(os.path.join(root, "krux-v1"))
+    second = _add_board(root, "v2", {"a": b"x", "b": b"x"})
+    replace = os.replace
+    failures = []
+
+    def full_disk(src, dst):
+        if not failures:
+            failures.append(dst)
+            raise OSError(errno.ENOSPC, "no space left")
+        return replace(src, dst)
+
+    monkeypatch.setattr(web_flasher.os, "replace", full_disk)
+    cache.dedupe(second)
+
+    names = sorted(os.listdir(second))
+    assert names == ["a", "b"]
+    linked = [n for n in names if os.path.samefile(os.path.join(second, n), os.path.join(first, "a"))]
+    assert len(linked) == 1 and failures
+
+
+def test_krux_release_is_pinned_while_it_downloads(monkeypatch):
+    pinned = []
+
+    def download(version, force=False, **kwargs):
+        pinned.append(dict(web_flasher.krux_cache._pinned))
+        raise web_flasher.DownloadError("offline")
+
+    monkeypatch.setattr(web_flasher, "download_krux_release", download)
+    monkeypatch.setattr(web_flasher.krux_manifests, "get", lambda version: {"boards": {}, "downloaded": False})
+    client = web_flasher.app.test_client()
+
+    response = client.post("/api/flash-krux", data={"version": "v9.9.9", "krux_board": "maixpy_dock", "port": "/dev/ttyTEST0"},
+                           environ_base={"REMOTE_ADDR": "127.0.0.1"})
+    job = web_flasher.flash_executor.get(response.get_json()["job"])
+    assert job.done.wait(5)
+
+    assert pinned == [{"v9.9.9": 1}]
+    assert "v9.9.9" not in web_flasher.krux_cache._pinned
+    assert job.state == "failed"
@@ -0,0 +1,78 @@
+import cProfile
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("serial")
+
+from kflash import SessionProfiler  # noqa: E402
+
+
+class OneProfilerPerProcess(cProfile.Profile):
+    """cProfile as on Python 3.12+, where a second active profiler can't be enabled."""
+
+    active = []
+
+    def enable(self, *args, **kwargs):
+        if self.active:
+            raise ValueError("Another profiling tool is already active")
+        self.active.append(self)
+        super().enable(*args, **kwargs)
+
+    def disable(self):
+        super().disable()
+        if self in self.active:
+            self.active.remove(self)
+
+
+@pytest.fixture
+def profiler():
+    profiler = SessionProfiler()
+    profiler._profile_class = OneProfilerPerProcess
+    yield profiler
+    profiler.stop()
+    OneProfilerPerProcess.active.clear()
+
+
+def test_wrapped_thread_runs_when_a_profiler_is_active(profiler):
+    assert profiler.start()
+    results = []
+    thread = threading.Thread(target=profiler.wrap(lambda: results.append(sum(range(1000)))))
+    thread.start()
+    thread.join(5)
+    profiler.stop()
+
+    assert results == [499500]
+    assert profiler.report()[0].startswith("Profile:")
+
+
+def test_second_session_is_not_profiled(profiler):
+    other = OneProfilerPerProcess()
+    other.enable()
+    try:
+        assert profiler.start() is False
+        assert profiler.wrap(lambda: 42)() == 42
+    finally:
+        other.disable()
+    profiler.stop()
+
+    assert profiler.report() == []
+
+
+def test_only_cancel_event_waits_count_as_sleep():
+    profiler = SessionProfiler()
+    cancel = threading.Event()
+    worker = threading.Thread(target=time.sleep, args=(0.2,))
+    assert profiler.start()
+    start = time.perf_counter()
+    cancel.wait(0.2)
+    profiler.add_sleep(time.perf_counter() - start)
+    worker.start()
+    worker.join()  # waiting for another thread is not sleeping
+    profiler.stop()
+
+    summary = profiler.report()[0]
+    slept = float(summary.split(", ")[3].split("s sleeping")[0])
+
+    assert 0.15 < slept < 0.3
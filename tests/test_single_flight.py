@@ -0,0 +1,92 @@
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("flask")
+pytest.importorskip("serial")
+
+from web_flasher import SingleFlight  # noqa: E402
+
+
+def test_single_flight_shares_one_call():
+    flights = SingleFlight()
+    calls = []
+    started = threading.Event()
+
+    def slow(value):
+        calls.append(value)
+        started.set()
+        time.sleep(0.2)
+        return value * 2
+
+    results = []
+    leader = threading.Thread(target=lambda: results.append(flights.do("k", slow, 21)))
+    leader.start()
+    started.wait(5)
+    followers = [threading.Thread(target=lambda: results.append(flights.do("k", slow, 21))) for _ in range(3)]
+    for thread in followers:
+        thread.start()
+    while flights.waiters("k") < 3:
+        time.sleep(0.01)
+    for thread in [leader] + followers:
+        thread.join(5)
+
+    assert calls == [21]
+    assert results == [42] * 4
+    assert flights.waiters("k") == 0
+
+
+def test_single_flight_shares_errors():
+    flights = SingleFlight()
+    started = threading.Event()
+    errors = []
+
+    def fail():
+        started.set()
+        time.sleep(0.2)
+        raise ValueError("boom")
+
+    def call():
+        try:
+            flights.do("k", fail)
+        except ValueError as exc:
+            errors.append(str(exc))
+
+    leader = threading.Thread(target=call)
+    leader.start()
+    started.wait(5)
+    follower = threading.Thread(target=call)
+    follower.start()
+    leader.join(5)
+    follower.join(5)
+
+    assert errors == ["boom", "boom"]
+
+
+
+
+def test_single_flight_keys_run_independently():
+    flights = SingleFlight()
+    gate = threading.Event()
+    started = set()
+    results = {}
+
+    def wait(key):
+        started.add(key)
+        gate.wait(5)
+        return key
+
+    threads = [threading.Thread(target=lambda k=k: results.update({k: flights.do(k, wait, k)})) for k in ("a", "b")]
+    for thread in threads:
+        thread.start()
+    deadline = time.time() + 5
+    while len(started) < 2 and time.time() < deadline:
+        time.sleep(0.01)
+    # both run at once, neither waits for the other key
+    assert started == {"a", "b"}
+    gate.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert results == {"a": "a", "b": "b"}
@@ -0,0 +1,76 @@
+import gzip
+
+import pytest
+
+pytest.importorskip("flask")
+pytest.importorskip("serial")
+
+import web_flasher  # noqa: E402
+from web_flasher import StaticAsset  # noqa: E402
+
+BODY = b"body { color: red; }\n" * 200
+LOCAL = {"REMOTE_ADDR": "127.0.0.1"}
+
+
+@pytest.fixture
+def asset(monkeypatch):
+    monkeypatch.setattr(web_flasher, "brotli", None)
+    return StaticAsset(BODY, "text/css", "no-cache")
+
+
+def test_encoding_choice(asset):
+    assert asset.pick_encoding("gzip, deflate") == "gzip"
+    assert asset.pick_encoding("br;q=1.0, gzip;q=0.5") == "gzip"
+    assert asset.pick_encoding("*") == "gzip"
+    assert asset.pick_encoding("gzip;q=0") == "identity"
+    assert asset.pick_encoding("deflate") == "identity"
+    assert asset.pick_encoding("") == "identity"
+
+
+def test_compressed_bodies(asset):
+    status, headers, body = asset.respond("gzip", "")
+
+    assert status == 200
+    assert headers["Content-Encoding"] == "gzip"
+    assert headers["Vary"] == "Accept-Encoding"
+    assert gzip.decompress(body) == BODY
+    assert asset.respond("identity", "")[2] == BODY
+
+
+def test_incompressible_body_is_sent_as_is(monkeypatch):
+    monkeypatch.setattr(web_flasher, "brotli", None)
+    asset = StaticAsset(b"x", "text/plain", "no-cache")
+
+    status, headers, body = asset.respond("gzip", "")
+
+    assert asset.pick_encoding("gzip") == "identity"
+    assert "Content-Encoding" not in headers and body == b"x"
+
+
+def test_not_modified(asset):
+    _, headers, _ = asset.respond("gzip", "")
+    etag = headers["ETag"]
+
+    assert asset.respond("gzip", etag)[0] == 304
+    assert asset.respond("gzip", "W/" + etag)[0] == 304
+    # the ETag of another encoding of the same content still matches
+    assert asset.respond("identity", etag)[0] == 304
+    assert asset.respond("gzip", '"other", ' + etag)[0] == 304
+    assert asset.respond("gzip", '"other"')[0] == 200
+    assert asset.respond("gzip", "*")[2] == b""
+
+
+def test_ui_routes():
+    client = web_flasher.app.test_client()
+
+    page = client.get("/", headers={"Accept-Encoding": "gzip"}, environ_base=LOCAL)
+    names = [name for name in web_flasher.UI_ASSETS if name != "index.html"]
+    again = client.get("/", headers={"If-None-Match": page.headers["ETag"]}, environ_base=LOCAL)
+    script = client.get("/ui/" + next(n for n in names if n.endswith(".js")), environ_base=LOCAL)
+
+    assert page.status_code == 200 and page.headers["Cache-Control"] == "no-cache"
+    assert all("/ui/" + name in gzip.decompress(page.data).decode() for name in names)
+    assert again.status_code == 304 and again.data == b""
+    assert script.status_code == 200 and "immutable" in script.headers["Cache-Control"]
+    assert client.get("/ui/index.html", environ_base=LOCAL).status_code == 404
+    assert client.get("/ui/app.missing.js", environ_base=LOCAL).status_code == 404
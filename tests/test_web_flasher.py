@@ -0,0 +1,103 @@
+import hashlib
+import http.server
+import os
+import threading
+
+import pytest
+
+pytest.importorskip("flask")
+pytest.importorskip("serial")
+
+import web_flasher  # noqa: E402
+from web_flasher import DownloadError, download_file  # noqa: E402
+
+BODY = os.urandom(200 * 1024)
+
+
+class ReleaseHandler(http.server.BaseHTTPRequestHandler):
+    """Serves BODY with Range support; `drop_first` cuts the first full response in half."""
+
+    drop_first = False
+    requests: list = []
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        srv = type(self)
+        srv.requests.append(self.headers.get("Range"))
+        range_header = self.headers.get("Range")
+        if range_header:
+            start = int(range_header.split("=")[1].rstrip("-"))
+            if start >= len(BODY):
+                self.send_response(416)
+                self.send_header("Content-Range", f"bytes */{len(BODY)}")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{len(BODY) - 1}/{len(BODY)}")
+            self.send_header("Content-Length", str(len(BODY) - start))
+            self.end_headers()
+            self.wfile.write(BODY[start:])
+            return
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        if srv.drop_first:
+            srv.drop_first = False
+            self.wfile.write(BODY[:len(BODY) // 2])
+            self.wfile.flush()
+            self.close_connection = True
+            return
+        self.wfile.write(BODY)
+
+
+@pytest.fixture
+def server(monkeypatch):
+    monkeypatch.setattr(web_flasher.time, "sleep", lambda seconds: None)
+    ReleaseHandler.drop_first = False
+    ReleaseHandler.requests = []
+    httpd = http.server.ThreadingHTTPServer(("127.0.0.1", 0), ReleaseHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_port}/krux.zip"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_download_resumes_after_dropped_connection(server, tmp_path):
+    ReleaseHandler.drop_first = True
+    dest = str(tmp_path / "krux.zip")
+    seen = []
+
+    download_file(server, dest, sha256=hashlib.sha256(BODY).hexdigest(), progress=lambda done, total: seen.append(done))
+
+    with open(dest, "rb") as f:
+        assert f.read() == BODY
+    assert ReleaseHandler.requests == [None, f"bytes={len(BODY) // 2}-"]
+    assert seen[-1] == len(BODY)
+    assert not os.path.exists(dest + ".part")
+
+
+def test_download_416_on_complete_part_file(server, tmp_path):
+    dest = str(tmp_path / "krux.zip")
+    with open(dest + ".part", "wb") as f:
+        f.write(BODY)
+
+    download_file(server, dest, sha256=hashlib.sha256(BODY).hexdigest())
+
+    with open(dest, "rb") as f:
+        assert f.read() == BODY
+    assert ReleaseHandler.requests == [f"bytes={len(BODY)}-"]
+
+
+def test_download_digest_mismatch(server, tmp_path):
+    dest = str(tmp_path / "krux.zip")
+
+    with pytest.raises(DownloadError):
+        download_file(server, dest, sha256="0" * 64)
+
+    assert not os.path.exists(dest)
+    assert not os.path.exists(dest + ".part")
+
@@ -0,0 +1,140 @@
+import collections
+import time
+
+import pytest
+
+pytest.importorskip("serial")
+
+from kflash import WireCapture, WireReplay, read_capture  # noqa: E402
+
+
+class EchoPort:
+    """Port stand-in whose device answers every write with b"ack:" and the data."""
+
+    def __init__(self):
+        self.port = "/dev/ttyTEST0"
+        self.baudrate = 115200
+        self.lines = []
+        self._out = collections.deque()
+
+    def write(self, data):
+        self._out.append(b"ack:" + bytes(data))
+        return len(data)
+
+    def read(self, size=1):
+        if not self._out:
+            return b""
+        data = self._out[0][:size]
+        self._out[0] = self._out[0][size:]
+        if not self._out[0]:
+            self._out.popleft()
+        return data
+
+    def inWaiting(self):
+        return sum(len(data) for data in self._out)
+
+    def setDTR(self, value=True):
+        self.lines.append(("DTR", value))
+
+    def setRTS(self, value=True):
+        self.lines.append(("RTS", value))
+
+    def close(self):
+        pass
+
+
+def record_session(path):
+    port = WireCapture(EchoPort(), path)
+    port.setDTR(False)
+    port.setRTS(True)
+    replies = []
+    for data in (b"hello", b"\xc0\x01\x02\xc0"):
+        port.write(data)
+        replies.append(port.read(64))
+    port.baudrate = 1500000
+    port.write(b"fast")
+    replies.append(port.read(2) + port.read(64))
+    port.close()
+    return replies
+
+
+def test_capture_records_the_wire(tmp_path):
+    path = str(tmp_path / "session.kfcap")
+    replies = record_session(path)
+
+    header, records = read_capture(path)
+
+    assert replies == [b"ack:hello", b"ack:\xc0\x01\x02\xc0", b"ack:fast"]
+    assert header == {"baudrate": 115200, "port": "/dev/ttyTEST0"}
+    assert [(kind, payload) for kind, _, payload in records] == [
+        (b"C", b"D\x00"), (b"C", b"R\x01"),
+        (b"W", b"hello"), (b"R", b"ack:hello"),
+        (b"W", b"\xc0\x01\x02\xc0"), (b"R", b"ack:\xc0\x01\x02\xc0"),
+        (b"B", (1500000).to_bytes(4, "little")),
+        (b"W", b"fast"), (b"R", b"ack:fast"),
+    ]
+    assert [t for _, t, _ in records] == sorted(t for _, t, _ in records)
+
+
+def test_replay_plays_back_the_device(tmp_path):
+    path = str(tmp_path / "session.kfcap")
+    replies = record_session(path)
+    replay = WireReplay(path, time_scale=0)
+
+    assert replay.read(64) == b""
+    replayed = []
+    for data in (b"hello", b"\xc0\x01\x02\xc0", b"fast"):
+        replay.write(data)
+        replayed.append(replay.read(2) + replay.read(64))
+
+    assert replayed == replies
+    assert replay.mismatches == 0
+
+
+def test_replay_counts_writes_that_differ(tmp_path):
+    path = str(tmp_path / "session.kfcap")
+    record_session(path)
+    replay = WireReplay(path, time_scale=0)
+
+    replay.write(b"other")
+    replay.write(b"\xc0\x01\x02\xc0")
+
+    assert replay.mismatches == 1
+    # the recorded device side is played back all the same
+    assert replay.read(64) == b"ack:hello" + b"ack:\xc0\x01\x02\xc0"
+
+
+def test_replay_keeps_the_recorded_delays(tmp_path):
+    path = str(tmp_path / "session.kfcap")
+    port = WireCapture(EchoPort(), path)
+    port.write(b"ping")
+    time.sleep(0.05)
+    port.read(64)
+    port.close()
+    replay = WireReplay(path, time_scale=1.0, timeout=0.5)
+
+    start = time.perf_counter()
+    replay.write(b"ping")
+    data = replay.read(64)
+
+    assert data == b"ack:ping"
+    assert time.perf_counter() - start >= 0.04
+
+
+def test_truncated_capture_keeps_the_complete_records(tmp_path):
+    path = tmp_path / "session.kfcap"
+    record_session(str(path))
+    data = path.read_bytes()
+    path.write_bytes(data[:-3])
+
+    _, records = read_capture(str(path))
+
+    assert records[-1][0] == b"W" and records[-1][2] == b"fast"
+
+
+def test_not_a_capture(tmp_path):
+    path = tmp_path / "session.kfcap"
+    path.write_bytes(b"garbage")
+
+    with pytest.raises(ValueError):
+        read_capture(str(path))
@@ -1,28 +1,60 @@
+import asyncio
+import errno
+import gzip
+import hashlib
+import http.client
+import io
+import json
 import os
+import re
 import shutil
 import sys
 import tempfile
 import threading
+import time
+import uuid
+import urllib.error
 import urllib.request
 import webbrowser
 import zipfile
-from typing import List, Optional
+from collections import OrderedDict, deque
+from typing import Callable, Dict, List, Optional, Union
 
-from flask import Flask, jsonify, render_template_string, request
+from flask import Flask, Response, jsonify, request
 from werkzeug.utils import secure_filename
 
 import serial.tools.list_ports
 
-from kflash import KFlash
+try:
+    import pyudev  # optional, tty hotplug events without polling on Linux
+except ImportError:
+    pyudev = None
+
+try:
+    import brotli  # optional, smaller precompressed UI for browsers that accept br
+except ImportError:
+    brotli = None
+
+from kflash import (FlashCancelled, KFlash, KfpkgPackage, SessionMetrics, SessionTracer, StreamingImage, async_flash,
+                    build_flash_plan, file_digest)
 
 
 app = Flask(__name__)
 app.config["MAX_CONTENT_LENGTH"] = 64 * 1024 * 1024  # 64MB bound
-flash_lock = threading.Lock()
 LOCAL_ONLY = {"127.0.0.1", "::1"}
 KRUX_CACHE_DIR = os.path.join(os.path.dirname(__file__), "krux_cache")
-_krux_lock = threading.Lock()
-_krux_versions_cache = {"ts": 0, "data": []}
+KRUX_RELEASES_URL = "https://api.github.com/repos/selfcustody/krux/releases?per_page=50"
+KRUX_FALLBACK_VERSIONS = ["v25.10.1", "v25.09.1", "v25.08.1", "v25.04.1"]
+KRUX_DOWNLOAD_BASE = os.environ.get("KRUX_DOWNLOAD_BASE", "https://github.com/selfcustody/krux/releases/download")
+DOWNLOAD_TIMEOUT = 30
+DOWNLOAD_RETRIES = 5
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+_krux_download_progress: dict = {}
+# selfcustody release key, firmware.bin.sig is a DER ECDSA signature of sha256(firmware.bin)
+KRUX_SIGNER_PUBKEY = "03339e883157e45891e61ca9df4cd3bb895ef32d475b8e793559ea10a36766689b"
+KRUX_CACHE_QUOTA = int(os.environ.get("KRUX_CACHE_MAX_MB", "512")) * 1024 * 1024  # 0 disables eviction
+JOB_LOG_LINES = int(os.environ.get("KFLASH_WEB_LOG_LINES", "500"))
+JOB_LOG_DIR = os.environ.get("KFLASH_WEB_LOG_DIR")  # when set, full job logs are kept there as JSON lines
 
 # Guard against python2
 if sys.version_info < (3, 7):
@@ -326,6 +358,7 @@ HOME_PAGE = """
         <select id="kruxBoard" name="krux_board">
           <option value="">Selecione após baixar o pacote</option>
         </select>
+        <label class="pill" style="align-self:flex-start;"><input type="checkbox" id="kruxFull"> Instalação completa (kboot.kfpkg + firmware.bin em uma sessão)</label>
         <div class="controls" style="margin-top:6px;">
           <button type="button" class="cta" id="kruxFlash">Flash Krux release</button>
           <span class="muted" id="kruxInfo">Use este atalho para baixar e flashear o firmware oficial Krux localmente.</span>
@@ -352,6 +385,7 @@ HOME_PAGE = """
           <div class="status" id="status"><span class="dot" id="dot"></span><span id="statusText">Pronto.</span></div>
           <div style="display:flex; gap:10px;">
             <button type="submit" class="cta">Flash firmware →</button>
+            <button type="button" class="ghost-btn" id="cancelFlash" disabled>Cancelar</button>
             <button type="reset" class="ghost-btn" id="clearLog">Limpar log</button>
           </div>
         </div>
@@ -369,12 +403,14 @@ HOME_PAGE = """
     const statusText = document.getElementById('statusText');
     const dot = document.getElementById('dot');
     const clearLogBtn = document.getElementById('clearLog');
+    const cancelBtn = document.getElementById('cancelFlash');
     const kruxDownloadBtn = document.getElementById('kruxDownload');
     const kruxFlashBtn = document.getElementById('kruxFlash');
     const kruxBoardSelect = document.getElementById('kruxBoard');
     const kruxInfo = document.getElementById('kruxInfo');
     const kruxBadge = document.getElementById('kruxBadge');
     const kruxVersionInput = document.getElementById('kruxVersion');
+    const kruxFullInput = document.getElementById('kruxFull');
     const pickFileBtn = document.getElementById('pickFile');
     const fileInput = document.getElementById('firmware');
     const fileNameSpan = document.getElementById('fileName');
@@ -383,21 +419,34 @@ HOME_PAGE = """
       try {
         const res = await fetch('/api/ports');
         const data = await res.json();
-        while (portSelect.options.length > 1) {
-          portSelect.remove(1);
-        }
-        data.ports.forEach(p => {
-          const opt = document.createElement('option');
-          opt.value = p.device;
-          opt.textContent = `${p.device} — ${p.description}`;
-          portSelect.appendChild(opt);
-        });
+        renderPorts(data.ports);
         setStatus(data.ports.length ? 'Portas atualizadas.' : 'Nenhuma porta encontrada.', data.ports.length ? 'ok' : 'neutral');
       } catch (err) {
         setStatus('Erro ao ler portas: ' + err, 'error');
       }
     }
 
+    function renderPorts(ports) {
+      const selected = portSelect.value;
+      while (portSelect.options.length > 1) {
+        portSelect.remove(1);
+      }
+      ports.forEach(p => {
+        const opt = document.createElement('option');
+        opt.value = p.device;
+        opt.textContent = `${p.device} — ${p.description}`;
+        portSelect.appendChild(opt);
+      });
+      portSelect.value = ports.some(p => p.device === selected) ? selected : 'auto';
+    }
+
+    function watchPorts() {
+      if (!window.EventSource) return;
+      // pushed by the server the moment a board is plugged in or removed
+      const events = new EventSource('/api/ports/events');
+      events.addEventListener('ports', e => renderPorts(JSON.parse(e.data).ports));
+    }
+
     function setStatus(text, type) {
       statusText.textContent = text;
       dot.classList.remove('active', 'error');
@@ -441,7 +490,7 @@ HOME_PAGE = """
       }
     }
 
-    async function loadKruxVersions() {
+    async function loadKruxVersions(retried) {
       try {
         const res = await fetch('/api/krux/releases');
         const data = await res.json();
@@ -457,6 +506,10 @@ HOME_PAGE = """
         if (!kruxVersionInput.value && versions.length) {
           kruxVersionInput.value = versions[0];
         }
+        if (data.refreshing && !retried) {
+          // the server is revalidating in the background, pick up the fresh list shortly
+          setTimeout(() => loadKruxVersions(true), 3000);
+        }
       } catch (err) {
         console.error('Erro ao carregar versões Krux', err);
       }
@@ -474,28 +527,96 @@ HOME_PAGE = """
 
     refreshBtn.addEventListener('click', loadPorts);
 
+    let currentJob = null;
+
+    cancelBtn.addEventListener('click', async () => {
+      if (!currentJob) return;
+      cancelBtn.disabled = true;
+      setStatus('Cancelando...', 'neutral');
+      try {
+        await fetch('/api/flash/cancel', { method: 'POST', body: new URLSearchParams({ job: currentJob }) });
+      } catch (err) {
+        // the job status reports the outcome
+      }
+    });
+
+    function flashStatus(data, done) {
+      if (data.success) return [done, 'ok'];
+      if (data.cancelled) return ['Flash cancelado.', 'neutral'];
+      return ['Falhou: ' + (data.error || 'veja o log'), 'error'];
+    }
+
+    function newJobId() {
+      return crypto.randomUUID().replace(/-/g, '');
+    }
+
+    // jobs run on the server flash workers, follow the log until the job ends
+    async function followJob(res, done) {
+      let data = await res.json();
+      while (data.success && (data.state === 'queued' || data.state === 'running')) {
+        setStatus(data.state === 'queued' ? 'Na fila, aguardando a porta...' : 'Flash em andamento...', 'ok');
+        logEl.textContent = (data.log || []).join('\\n');
+        await new Promise(resolve => setTimeout(resolve, 500));
+        data = await (await fetch(`/api/flash/jobs/${data.job}`)).json();
+      }
+      logEl.textContent = (data.log || []).join('\\n');
+      setStatus(...flashStatus(data, done));
+    }
+
     form.addEventListener('submit', async (e) => {
       e.preventDefault();
       const formData = new FormData(form);
+      const file = fileInput.files[0];
       setStatus('Flash em andamento...', 'ok');
       logEl.textContent = '';
-      const controls = Array.from(form.elements);
+      const controls = Array.from(form.elements).filter(el => el !== cancelBtn);
       controls.forEach(el => el.disabled = true);
+      cancelBtn.disabled = false;
+      currentJob = newJobId();
       try {
-        const res = await fetch('/api/flash', { method: 'POST', body: formData });
-        const data = await res.json();
-        logEl.textContent = (data.log || []).join('\\n');
-        setStatus(data.success ? 'Flash concluído.' : 'Falhou: ' + (data.error || 'veja o log'), data.success ? 'ok' : 'error');
+        let res;
+        if (file && file.name.toLowerCase().endsWith('.bin')) {
+          // raw bins are flashed while they upload, the request returns once the job ends
+          const params = new URLSearchParams({ port: formData.get('port') || 'auto', name: file.name, job: currentJob });
+          res = await fetch('/api/flash/stream?' + params, {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/octet-stream' },
+            body: file,
+          });
+        } else {
+          formData.append('job', currentJob);
+          res = await fetch('/api/flash', { method: 'POST', body: formData });
+        }
+        await followJob(res, 'Flash concluído.');
       } catch (err) {
         setStatus('Erro inesperado: ' + err, 'error');
       } finally {
         controls.forEach(el => el.disabled = false);
+        cancelBtn.disabled = true;
       }
     });
 
+    function formatMiB(bytes) {
+      return (bytes / (1024 * 1024)).toFixed(1) + ' MiB';
+    }
+
+    async function pollKruxProgress(version) {
+      try {
+        const res = await fetch(`/api/krux/download/progress?version=${encodeURIComponent(version)}`);
+        const data = await res.json();
+        if (data.success && data.state === 'downloading') {
+          const pct = data.total ? ` (${Math.floor(100 * data.downloaded / data.total)}%)` : '';
+          setStatus(`Baixando release Krux... ${formatMiB(data.downloaded)}${data.total ? ' / ' + formatMiB(data.total) : ''}${pct}`, 'neutral');
+        }
+      } catch (err) {
+        // progress is best effort
+      }
+    }
+
     kruxDownloadBtn.addEventListener('click', async () => {
       setStatus('Baixando release Krux...', 'neutral');
       kruxDownloadBtn.disabled = true;
+      const progressTimer = setInterval(() => pollKruxProgress(kruxVersionInput.value || 'v25.10.1'), 500);
       try {
         const formData = new FormData();
         formData.append('version', kruxVersionInput.value || 'v25.10.1');
@@ -510,6 +631,7 @@ HOME_PAGE = """
       } catch (err) {
         setStatus('Erro ao baixar Krux: ' + err, 'error');
       } finally {
+        clearInterval(progressTimer);
         kruxDownloadBtn.disabled = false;
       }
     });
@@ -524,26 +646,30 @@ HOME_PAGE = """
       formData.append('krux_board', boardValue);
       formData.append('version', kruxVersionInput.value || 'v25.10.1');
       formData.append('port', portSelect.value);
+      formData.append('krux_image', kruxFullInput.checked ? 'full' : 'firmware');
 
       setStatus('Flash Krux em andamento...', 'ok');
       logEl.textContent = '';
-      const controls = Array.from(form.elements).concat([kruxDownloadBtn, kruxFlashBtn, kruxBoardSelect]);
+      const controls = Array.from(form.elements).filter(el => el !== cancelBtn).concat([kruxDownloadBtn, kruxFlashBtn, kruxBoardSelect, kruxFullInput]);
       controls.forEach(el => el.disabled = true);
+      cancelBtn.disabled = false;
+      currentJob = newJobId();
+      formData.append('job', currentJob);
       try {
         const res = await fetch('/api/flash-krux', { method: 'POST', body: formData });
-        const data = await res.json();
-        logEl.textContent = (data.log || []).join('\\n');
-        setStatus(data.success ? 'Flash Krux concluído.' : 'Falhou: ' + (data.error || 'veja o log'), data.success ? 'ok' : 'error');
+        await followJob(res, 'Flash Krux concluído.');
       } catch (err) {
         setStatus('Erro inesperado: ' + err, 'error');
       } finally {
         controls.forEach(el => el.disabled = false);
+        cancelBtn.disabled = true;
       }
     });
 
     window.addEventListener('load', loadPorts);
+    window.addEventListener('load', watchPorts);
     window.addEventListener('load', () => loadKruxStatus());
-    window.addEventListener('load', loadKruxVersions);
+    window.addEventListener('load', () => loadKruxVersions());
   </script>
 </body>
 </html>
@@ -554,17 +680,130 @@ def parse_bool(value: str) -> bool:
     return str(value).lower() in {"1", "true", "on", "yes"}
 
 
-def collect_ports():
-    ports = []
-    for info in serial.tools.list_ports.comports():
-        ports.append(
+class PortRegistry:
+    """
+    Serial ports kept in memory, indexed by device, VID, VID:PID, serial number and
+    USB location. A background thread rescans only on udev tty events (pyudev), or
+    when the /sys/class/tty listing changes, or by polling comports() elsewhere;
+    listing and auto detection are lookups in this table.
+    """
+
+    POLL_INTERVAL = 0.5
+    FALLBACK_POLL_INTERVAL = 2.0
+    SYS_TTY = "/sys/class/tty"
+    VID_PATTERN = re.compile(r"\(?[0-9A-Fa-f]{4}\)?(?:\|\(?[0-9A-Fa-f]{4}\)?)*")
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._ports: list = []
+        self._index: dict = {"device": {}, "vid": {}, "vid_pid": {}, "serial": {}, "location": {}}
+        self._thread: Optional[threading.Thread] = None
+        self.version = 0
+
+    def start(self) -> None:
+        with self._cond:
+            if self._thread is not None:
+                return
+            # first scan under the lock, so no caller sees an empty table
+            self.refresh()
+            self._thread = threading.Thread(target=self._run, name="port-registry", daemon=True)
+            self._thread.start()
+
+    def refresh(self) -> bool:
+        """Rescan the ports, return True (and wake the waiters) when the table changed."""
+        infos = list(serial.tools.list_ports.comports())
+        index: dict = {"device": {}, "vid": {}, "vid_pid": {}, "serial": {}, "location": {}}
+        for info in infos:
+            index["device"][info.device] = info
+            if info.vid is not None:
+                index["vid"].setdefault("%04X" % info.vid, []).append(info)
+                index["vid_pid"].setdefault("%04X:%04X" % (info.vid, info.pid or 0), []).append(info)
+            if info.serial_number:
+                index["serial"].setdefault(info.serial_number, []).append(info)
+            if info.location:
+                index["location"][info.location] = info
+        with self._cond:
+            if [(i.device, i.hwid) for i in infos] == [(i.device, i.hwid) for i in self._ports]:
+                return False
+            self._ports, self._index = infos, index
+            self.version += 1
+            self._cond.notify_all()
+        return True
+
+    def _run(self) -> None:
+        if pyudev is not None:
+            try:
+                monitor = pyudev.Monitor.from_netlink(pyudev.Context())
+                monitor.filter_by(subsystem="tty")
+                for _device in iter(monitor.poll, None):
+                    self.refresh()
+            except Exception as exc:  # noqa: BLE001
+                print(f"Monitor udev indisponível ({exc}), usando polling de portas")
+        listing = None
+        while True:
+            if os.path.isdir(self.SYS_TTY):
+                # a directory listing is far cheaper than a comports() scan
+                current = sorted(os.listdir(self.SYS_TTY))
+                if current != listing:
+                    listing = current
+                    self.refresh()
+                time.sleep(self.POLL_INTERVAL)
+            else:
+                self.refresh()
+                time.sleep(self.FALLBACK_POLL_INTERVAL)
+
+    def ports(self) -> List[dict]:
+        self.start()
+        with self._cond:
+            infos = list(self._ports)
+        return [
             {
                 "device": info.device,
                 "description": info.description or "",
                 "hwid": info.hwid,
+                "vid": info.vid,
+                "pid": info.pid,
+                "serial_number": info.serial_number,
+                "location": info.location,
             }
-        )
-    return ports
+            for info in infos
+        ]
+
+    def lookup(self, key: str, value: str) -> list:
+        """Ports by "device", "vid" ("1A86"), "vid_pid" ("1A86:7523"), "serial" or "location"."""
+        self.start()
+        with self._cond:
+            found = self._index[key].get(value.upper() if key in ("vid", "vid_pid") else value)
+        if found is None:
+            return []
+        return list(found) if isinstance(found, list) else [found]
+
+    def grep(self, pattern: str) -> list:
+        """Drop-in for serial.tools.list_ports.grep on the cached table (KFlash.port_lookup)."""
+        self.start()
+        with self._cond:
+            ports, index = self._ports, self._index
+        if self.VID_PATTERN.fullmatch(pattern):
+            # VID alternations like kflash's auto lookup list are index hits
+            found = {id(info) for vid in re.findall(r"[0-9A-Fa-f]{4}", pattern) for info in index["vid"].get(vid.upper(), ())}
+            return [info for info in ports if id(info) in found]
+        regexp = re.compile(pattern, re.I)
+        return [info for info in ports if regexp.search(info.device) or regexp.search(info.description) or regexp.search(info.hwid)]
+
+    def wait(self, version: int, timeout: float) -> int:
+        """Block until the table version differs from version (or timeout), return the current one."""
+        self.start()
+        with self._cond:
+            self._cond.wait_for(lambda: self.version != version, timeout)
+            return self.version
+
+
+port_registry = PortRegistry()
+KFlash.port_lookup = port_registry.grep
+
+
+def collect_ports():
+    return port_registry.ports()
 
 
 def ensure_local_only():
@@ -579,7 +818,7 @@ def krux_paths(version: str) -> dict:
         if not (ch.isalnum() or ch in {".", "-", "_", "v"}):
             raise ValueError("Versão inválida.")
     zip_name = f"krux-{safe_version}.zip"
-    url = f"https://github.com/selfcustody/krux/releases/download/{safe_version}/{zip_name}"
+    url = f"{KRUX_DOWNLOAD_BASE}/{safe_version}/{zip_name}"
     root_dir = os.path.join(KRUX_CACHE_DIR, f"krux-{safe_version}")
     return {"version": safe_version, "zip_name": zip_name, "url": url, "root_dir": root_dir}
 
@@ -592,104 +831,1610 @@ def get_krux_root_dir(version: str) -> Optional[str]:
     return None
 
 
-def download_krux_release(version: str, force: bool = False) -> dict:
+class DownloadError(Exception):
+    pass
+
+
+def _content_range_total(value: Optional[str]) -> Optional[int]:
+    # "bytes 100-199/200" or "bytes */200"
+    match = re.match(r"bytes\s+(?:\d+-\d+|\*)/(\d+)", value or "")
+    return int(match.group(1)) if match else None
+
+
+def download_file(
+    url: str,
+    dest: str,
+    sha256: Optional[str] = None,
+    progress: Optional[Callable[[int, Optional[int]], None]] = None,
+    timeout: float = DOWNLOAD_TIMEOUT,
+    retries: int = DOWNLOAD_RETRIES,
+) -> str:
+    """Download url into dest.part, resuming with HTTP Range after a dropped
+    connection, then verify size and digest and atomically rename to dest."""
+    part_path = dest + ".part"
+    total: Optional[int] = None
+    attempt = 0
+    while True:
+        offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+        if total is not None and offset >= total:
+            break
+        headers = {"User-Agent": "k210-web-flasher"}
+        if offset:
+            headers["Range"] = f"bytes={offset}-"
+        try:
+            with urllib.request.urlopen(urllib.request.Request(url, headers=headers), timeout=timeout) as resp:
+                if offset and resp.status == 206:
+                    total = _content_range_total(resp.headers.get("Content-Range"))
+                    mode = "ab"
+                else:
+                    # server ignored the range, start over
+                    offset = 0
+                    length = resp.headers.get("Content-Length")
+                    total = int(length) if length and length.isdigit() else None
+                    mode = "wb"
+                done = offset
+                if progress:
+                    progress(done, total)
+                with open(part_path, mode) as f:
+                    while True:
+                        chunk = resp.read(DOWNLOAD_CHUNK_SIZE)
+                        if not chunk:
+                            break
+                        f.write(chunk)
+                        done += len(chunk)
+                        if progress:
+                            progress(done, total)
+            if total is None or done >= total:
+                break
+            raise DownloadError(f"conexão encerrada após {done} de {total} bytes")
+        except urllib.error.HTTPError as exc:
+            if exc.code == 416 and offset:
+                # the partial file is already complete (or bogus); let verification decide
+                total = _content_range_total(exc.headers.get("Content-Range")) or offset
+                break
+            if exc.code < 500:
+                raise DownloadError(f"HTTP {exc.code} ao baixar {url}") from exc
+            error: Exception = exc
+        except (urllib.error.URLError, http.client.HTTPException, OSError, DownloadError) as exc:
+            error = exc
+        attempt += 1
+        if attempt > retries:
+            raise DownloadError(f"Falha ao baixar {url}: {error}")
+        time.sleep(min(2 ** attempt, 30))
+
+    size = os.path.getsize(part_path)
+    if total is not None and size != total:
+        os.remove(part_path)
+        raise DownloadError(f"Tamanho inesperado: {size} bytes, esperado {total}.")
+    if sha256:
+        digest = hashlib.sha256()
+        with open(part_path, "rb") as f:
+            for block in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(block)
+        if digest.hexdigest() != sha256.lower():
+            os.remove(part_path)
+            raise DownloadError("SHA256 do download não confere.")
+    os.replace(part_path, dest)
+    return dest
+
+
+def fetch_expected_sha256(url: str) -> Optional[str]:
+    """Read the published "<sha256>  <file>" companion file, None if unavailable."""
+    req = urllib.request.Request(url, headers={"User-Agent": "k210-web-flasher"})
+    try:
+        with urllib.request.urlopen(req, timeout=DOWNLOAD_TIMEOUT) as resp:
+            match = re.search(r"\b[0-9a-fA-F]{64}\b", resp.read(4096).decode("utf-8", "replace"))
+    except (urllib.error.URLError, OSError):
+        return None
+    return match.group(0).lower() if match else None
+
+
+class SingleFlight:
+    """Run one call per key at a time; concurrent callers with the same key wait for it and share its result."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: dict = {}
+
+    def waiters(self, key) -> int:
+        with self._lock:
+            call = self._calls.get(key)
+            return call["waiters"] if call else 0
+
+    def do(self, key, func: Callable, *args, **kwargs):
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = {"done": threading.Event(), "waiters": 0}
+            else:
+                call["waiters"] += 1
+        if not leader:
+            call["done"].wait()
+            if "error" in call:
+                raise call["error"]
+            return call["result"]
+        try:
+            call["result"] = func(*args, **kwargs)
+            return call["result"]
+        except BaseException as exc:
+            call["error"] = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call["done"].set()
+
+
+# in-progress downloads and extractions, keyed by version (and board)
+krux_flights = SingleFlight()
+
+
+def download_krux_release(version: str, force: bool = False, throttle: Optional[Callable[[], None]] = None, evict: bool = True) -> dict:
+    """Download a release zip; concurrent calls for the same version share one download.
+    With evict=False the cache quota is left to the caller instead of evicting other versions."""
     paths = krux_paths(version)
+    return krux_flights.do(("download", paths["version"]), _download_krux_release, paths, force, throttle, evict)
+
+
+def _download_krux_release(paths: dict, force: bool, throttle: Optional[Callable[[], None]], evict: bool) -> dict:
     os.makedirs(KRUX_CACHE_DIR, exist_ok=True)
     zip_path = os.path.join(KRUX_CACHE_DIR, paths["zip_name"])
     if force and os.path.exists(zip_path):
         os.remove(zip_path)
     if not os.path.exists(zip_path):
-        with urllib.request.urlopen(paths["url"]) as resp, open(zip_path, "wb") as f:
-            shutil.copyfileobj(resp, f)
+        state = {"state": "downloading", "downloaded": 0, "total": None}
+        _krux_download_progress[paths["version"]] = state
+
+        def report(done: int, total: Optional[int]) -> None:
+            state.update(downloaded=done, total=total)
+            if throttle:
+                throttle()
+
+        started = time.monotonic()
+        try:
+            sha256 = fetch_expected_sha256(paths["url"] + ".sha256.txt")
+            download_file(paths["url"], zip_path, sha256=sha256, progress=report)
+            if not sha256:
+                # no published digest, at least check every member CRC
+                with zipfile.ZipFile(zip_path) as zf:
+                    bad = zf.testzip()
+                if bad:
+                    os.remove(zip_path)
+                    raise DownloadError(f"Arquivo corrompido no zip: {bad}")
+        except Exception as exc:
+            state.update(state="error", error=str(exc))
+            flash_stats.observe("k210_krux_download_duration_seconds", time.monotonic() - started, FlashStats.DOWNLOAD_BUCKETS, (("outcome", "failure"),))
+            raise
+        state["state"] = "done"
+        flash_stats.observe("k210_krux_download_duration_seconds", time.monotonic() - started, FlashStats.DOWNLOAD_BUCKETS, (("outcome", "success"),))
+        if evict:
+            krux_cache.enforce_quota(keep=(paths["version"],))
+        # build the board manifest now, status and flash requests become lookups
+        krux_manifests.get(paths["version"])
     root_dir = paths["root_dir"]
     if force and os.path.isdir(root_dir):
         shutil.rmtree(root_dir, ignore_errors=True)
-    if not os.path.isdir(root_dir):
-        with zipfile.ZipFile(zip_path, "r") as zf:
-            zf.extractall(KRUX_CACHE_DIR)
+    # boards are extracted one at a time, on demand, by extract_krux_board
     return {"zip_path": zip_path, "root_dir": root_dir, "version": paths["version"]}
 
 
-def list_krux_boards(version: str) -> List[dict]:
-    boards = []
-    root = get_krux_root_dir(version)
-    if not root:
+def extract_krux_board(version: str, board_id: str, evict: bool = True) -> str:
+    """Extract a single board of the release zip, atomically, and return its directory."""
+    paths = krux_paths(version)
+    return krux_flights.do(("extract", paths["version"], board_id), _extract_krux_board, paths, board_id, evict)
+
+
+def krux_board_size(version: str, board_id: str) -> int:
+    """Bytes a board takes once extracted from the downloaded release zip."""
+    paths = krux_paths(version)
+    prefix = f"krux-{paths['version']}/{board_id}/"
+    with zipfile.ZipFile(os.path.join(KRUX_CACHE_DIR, paths["zip_name"])) as zf:
+        return sum(info.file_size for info in zf.infolist() if info.filename.startswith(prefix) and not info.is_dir())
+
+
+def _extract_krux_board(paths: dict, board_id: str, evict: bool) -> str:
+    board_dir = os.path.join(paths["root_dir"], board_id)
+    if os.path.isfile(os.path.join(board_dir, "firmware.bin")):
+        return board_dir
+    zip_path = os.path.join(KRUX_CACHE_DIR, paths["zip_name"])
+    prefix = f"krux-{paths['version']}/{board_id}/"
+    os.makedirs(paths["root_dir"], exist_ok=True)
+    tmpdir = tempfile.mkdtemp(prefix=f".{board_id}-", dir=paths["root_dir"])
+    try:
+        with zipfile.ZipFile(zip_path) as zf:
+            members = [info for info in zf.infolist() if info.filename.startswith(prefix) and not info.is_dir()]
+            if not members:
+                raise ValueError("Placa Krux não encontrada na release baixada.")
+            for info in members:
+                rel_parts = info.filename[len(prefix):].split("/")
+                if ".." in rel_parts or not all(rel_parts):
+                    continue
+                target = os.path.join(tmpdir, *rel_parts)
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+                with zf.open(info) as src, open(target, "wb") as dst:
+                    shutil.copyfileobj(src, dst)
+        try:
+            os.rename(tmpdir, board_dir)
+        except OSError:
+            # another request extracted the same board first
+            if not os.path.isfile(os.path.join(board_dir, "firmware.bin")):
+                raise
+    finally:
+        shutil.rmtree(tmpdir, ignore_errors=True)
+    krux_cache.dedupe(board_dir)
+    krux_cache.verify_firmware(os.path.join(board_dir, "firmware.bin"))
+    if evict:
+        krux_cache.enforce_quota(keep=(paths["version"],))
+    return board_dir
+
+
+_SECP256K1_P = 2**256 - 2**32 - 977
+_SECP256K1_N = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
+_SECP256K1_G = (
+    0x79BE667EF9DCBBAC55A06295CE870B07029BFCDB2DCE28D959F2815B16F81798,
+    0x483ADA7726A3C4655DA4FBFC0E1108A8FD17B448A68554199C47D08FFB10D4B8,
+)
+
+
+def _ec_add(a: Optional[tuple], b: Optional[tuple]) -> Optional[tuple]:
+    p = _SECP256K1_P
+    if a is None:
+        return b
+    if b is None:
+        return a
+    if a[0] == b[0] and (a[1] + b[1]) % p == 0:
+        return None
+    if a == b:
+        slope = 3 * a[0] * a[0] * pow(2 * a[1], p - 2, p) % p
+    else:
+        slope = (b[1] - a[1]) * pow(b[0] - a[0], p - 2, p) % p
+    x = (slope * slope - a[0] - b[0]) % p
+    return x, (slope * (a[0] - x) - a[1]) % p
+
+
+def _ec_mul(k: int, point: Optional[tuple]) -> Optional[tuple]:
+    result = None
+    while k:
+        if k & 1:
+            result = _ec_add(result, point)
+        point = _ec_add(point, point)
+        k >>= 1
+    return result
+
+
+def _ec_pubkey(compressed_hex: str) -> tuple:
+    raw = bytes.fromhex(compressed_hex)
+    if len(raw) != 33 or raw[0] not in (2, 3):
+        raise ValueError("Chave pública inválida.")
+    p = _SECP256K1_P
+    x = int.from_bytes(raw[1:], "big")
+    y = pow((pow(x, 3, p) + 7) % p, (p + 1) // 4, p)
+    if y % 2 != raw[0] - 2:
+        y = p - y
+    return x, y
+
+
+def _der_signature(sig: bytes) -> tuple:
+    # SEQUENCE { INTEGER r, INTEGER s }
+    if len(sig) < 8 or sig[0] != 0x30 or sig[1] != len(sig) - 2:
+        raise ValueError("Assinatura DER inválida.")
+    values = []
+    pos = 2
+    for _ in range(2):
+        if pos + 2 > len(sig) or sig[pos] != 0x02:
+            raise ValueError("Assinatura DER inválida.")
+        length = sig[pos + 1]
+        values.append(int.from_bytes(sig[pos + 2:pos + 2 + length], "big"))
+        pos += 2 + length
+    if pos != len(sig):
+        raise ValueError("Assinatura DER inválida.")
+    return values[0], values[1]
+
+
+def ecdsa_verify(digest: bytes, signature: bytes, pubkey_hex: str = KRUX_SIGNER_PUBKEY) -> bool:
+    """Verify a DER secp256k1 ECDSA signature of a sha256 digest, without third-party crypto."""
+    n = _SECP256K1_N
+    try:
+        r, s = _der_signature(signature)
+        pubkey = _ec_pubkey(pubkey_hex)
+    except ValueError:
+        return False
+    if not (0 < r < n and 0 < s < n):
+        return False
+    w = pow(s, n - 2, n)
+    z = int.from_bytes(digest, "big")
+    point = _ec_add(_ec_mul(z * w % n, _SECP256K1_G), _ec_mul(r * w % n, pubkey))
+    return point is not None and point[0] % n == r
+
+
+class KruxCache:
+    """Disk quota, LRU eviction by last flash time and content-addressed dedupe for KRUX_CACHE_DIR."""
+
+    INDEX_NAME = "cache-index.json"
+    OBJECTS_DIR = "objects"
+    # os.link errors that mean the filesystem has no hardlinks (e.g. FAT SD cards)
+    NO_HARDLINKS = (errno.EXDEV, errno.EPERM, errno.ENOTSUP)
+
+    def __init__(self, root: str, quota_bytes: int):
+        self.root = root
+        self.quota_bytes = quota_bytes
+        self._lock = threading.RLock()
+        self._index: Optional[dict] = None
+        self._pinned: dict = {}
+
+    def _load(self) -> dict:
+        if self._index is None:
+            try:
+                with open(os.path.join(self.root, self.INDEX_NAME), "r", encoding="utf-8") as f:
+                    self._index = json.load(f)
+            except (OSError, ValueError):
+                self._index = {}
+            self._index.setdefault("versions", {})
+            self._index.setdefault("hits", 0)
+            self._index.setdefault("misses", 0)
+            self._index.setdefault("signatures", {})
+        return self._index
+
+    def _save(self) -> None:
+        os.makedirs(self.root, exist_ok=True)
+        path = os.path.join(self.root, self.INDEX_NAME)
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(self._load(), f, indent=1)
+        os.replace(path + ".tmp", path)
+
+    def _entry(self, version: str) -> dict:
+        return self._load()["versions"].setdefault(version, {})
+
+    def record(self, version: str, hit: bool) -> None:
+        with self._lock:
+            index = self._load()
+            index["hits" if hit else "misses"] += 1
+            self._entry(version).setdefault("added", time.time())
+            self._save()
+
+    def lookups(self) -> tuple:
+        with self._lock:
+            index = self._load()
+            return index["hits"], index["misses"]
+
+    def touch(self, version: str) -> None:
+        """Mark a version as just flashed, the LRU order is by last flash time."""
+        with self._lock:
+            self._entry(version)["last_flash"] = time.time()
+            self._save()
+
+    def verify_firmware(self, fw_path: str) -> Optional[bool]:
+        """
+        Signature check of a firmware.bin against firmware.bin.sig: True, False, or None
+        when there is no signature. The result is recorded with the digest and the
+        size/mtime of both files, and only computed again when one of them changes.
+        """
+        sig_path = fw_path + ".sig"
+        try:
+            st = os.stat(fw_path)
+            sig_st = os.stat(sig_path)
+        except FileNotFoundError:
+            return None
+        stamp = [st.st_size, st.st_mtime, sig_st.st_size, sig_st.st_mtime]
+        key = os.path.relpath(os.path.realpath(fw_path), os.path.realpath(self.root))
+        with self._lock:
+            record = self._load()["signatures"].get(key)
+            if record and record["stamp"] == stamp:
+                return record["valid"]
+            digest = file_digest(fw_path)
+            with open(sig_path, "rb") as f:
+                valid = ecdsa_verify(bytes.fromhex(digest), f.read())
+            self._load()["signatures"][key] = {"sha256": digest, "stamp": stamp, "valid": valid}
+            self._save()
+        return valid
+
+    class _Pin:
+        def __init__(self, cache: "KruxCache", version: str):
+            self.cache = cache
+            self.version = version
+
+        def __enter__(self):
+            with self.cache._lock:
+                self.cache._pinned[self.version] = self.cache._pinned.get(self.version, 0) + 1
+            return self
+
+        def __exit__(self, *exc):
+            with self.cache._lock:
+                self.cache._pinned[self.version] -= 1
+                if not self.cache._pinned[self.version]:
+                    del self.cache._pinned[self.version]
+
+    def pin(self, version: str) -> "KruxCache._Pin":
+        """Keep a version from being evicted while it is in use."""
+        return KruxCache._Pin(self, version)
+
+    def versions(self) -> List[str]:
+        found = set()
+        if os.path.isdir(self.root):
+            for name in os.listdir(self.root):
+                if not name.startswith("krux-"):
+                    continue
+                if name.endswith(".zip"):
+                    found.add(name[len("krux-"):-len(".zip")])
+                elif os.path.isdir(os.path.join(self.root, name)):
+                    found.add(name[len("krux-"):])
+        return sorted(found)
+
+    def _version_paths(self, version: str) -> List[str]:
+        return [os.path.join(self.root, f"krux-{version}.zip"), os.path.join(self.root, f"krux-{version}")]
+
+    @staticmethod
+    def _usage(paths: List[str], seen: Optional[set] = None) -> int:
+        # hardlinked files are only counted once
+        seen = set() if seen is None else seen
+        total = 0
+        for top in paths:
+            walker = [(os.path.dirname(top), [], [os.path.basename(top)])] if os.path.isfile(top) else os.walk(top)
+            for dirpath, _, files in walker:
+                for name in files:
+                    try:
+                        st = os.stat(os.path.join(dirpath, name))
+                    except OSError:
+                        continue
+                    if (st.st_dev, st.st_ino) not in seen:
+                        seen.add((st.st_dev, st.st_ino))
+                        total += st.st_size
+        return total
+
+    def usage(self) -> int:
+        return self._usage([self.root]) if os.path.isdir(self.root) else 0
+
+    def _last_used(self, version: str) -> float:
+        entry = self._load()["versions"].get(version, {})
+        if entry.get("last_flash") or entry.get("added"):
+            return entry.get("last_flash") or entry["added"]
+        mtimes = [os.path.getmtime(p) for p in self._version_paths(version) if os.path.exists(p)]
+        return max(mtimes) if mtimes else 0.0
+
+    def dedupe(self, directory: str) -> None:
+        """Hardlink identical artifacts (e.g. an unchanged kboot.kfpkg) to one object in the store."""
+        objects = os.path.join(self.root, self.OBJECTS_DIR)
+        os.makedirs(objects, exist_ok=True)
+        with self._lock:
+            for dirpath, _, files in os.walk(directory):
+                for name in files:
+                    path = os.path.join(dirpath, name)
+                    obj = os.path.join(objects, file_digest(path))
+                    try:
+                        if not os.path.exists(obj):
+                            os.link(path, obj)
+                        elif not os.path.samefile(obj, path):
+                            os.link(obj, path + ".dedupe")
+                            os.replace(path + ".dedupe", path)
+                    except OSError as exc:
+                        if exc.errno in self.NO_HARDLINKS:
+                            # keep plain copies of the whole tree
+                            return
+                        # e.g. ENOSPC or EACCES, keep this copy and go on with the next file
+                        try:
+                            os.remove(path + ".dedupe")
+                        except OSError:
+                            pass
+
+    def _gc_objects(self) -> None:
+        objects = os.path.join(self.root, self.OBJECTS_DIR)
+        if not os.path.isdir(objects):
+            return
+        for name in os.listdir(objects):
+            path = os.path.join(objects, name)
+            try:
+                if os.stat(path).st_nlink <= 1:
+                    os.remove(path)
+            except OSError:
+                pass
+
+    def evict(self, version: str) -> None:
+        with self._lock:
+            for path in self._version_paths(version):
+                if os.path.isdir(path):
+                    shutil.rmtree(path, ignore_errors=True)
+                elif os.path.exists(path):
+                    os.remove(path)
+            self._load()["versions"].pop(version, None)
+            prefix = f"krux-{version}{os.sep}"
+            signatures = self._load()["signatures"]
+            for key in [k for k in signatures if k.startswith(prefix)]:
+                del signatures[key]
+            self._gc_objects()
+            self._save()
+
+    def enforce_quota(self, keep: tuple = ()) -> List[str]:
+        """Evict least recently flashed versions until the cache fits in the quota."""
+        evicted: List[str] = []
+        if self.quota_bytes <= 0:
+            return evicted
+        with self._lock:
+            while self.usage() > self.quota_bytes:
+                candidates = [v for v in self.versions() if v not in keep and v not in self._pinned]
+                if not candidates:
+                    break
+                victim = min(candidates, key=self._last_used)
+                self.evict(victim)
+                evicted.append(victim)
+        return evicted
+
+    def status(self) -> dict:
+        with self._lock:
+            index = self._load()
+            lookups = index["hits"] + index["misses"]
+            seen: set = set()
+            versions = []
+            for version in self.versions():
+                entry = index["versions"].get(version, {})
+                versions.append({
+                    "version": version,
+                    "size_bytes": self._usage(self._version_paths(version), seen),
+                    "last_flash": entry.get("last_flash"),
+                })
+            return {
+                "size_bytes": self.usage(),
+                "quota_bytes": self.quota_bytes,
+                "hits": index["hits"],
+                "misses": index["misses"],
+                "hit_rate": index["hits"] / lookups if lookups else None,
+                "versions": versions,
+            }
+
+
+krux_cache = KruxCache(KRUX_CACHE_DIR, KRUX_CACHE_QUOTA)
+
+
+class KruxManifestIndex:
+    """
+    Per-version board manifest (firmware paths, sizes, digests, signature and
+    kboot presence), kept in memory and rebuilt only when the mtime of the
+    release zip changes, or the size or mtime of a file of an extracted board.
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+        self._lock = threading.Lock()
+        self._zip_boards: dict = {}
+        self._dir_boards: dict = {}
+
+    @staticmethod
+    def _mtime(path: str) -> Optional[float]:
+        try:
+            return os.stat(path).st_mtime
+        except OSError:
+            return None
+
+    @staticmethod
+    def _dir_stamp(root_dir: str) -> Optional[tuple]:
+        # editing a file in a board directory leaves the release directory mtime alone
+        try:
+            entries = sorted(os.listdir(root_dir))
+        except OSError:
+            return None
+        stamp = []
+        for entry in entries:
+            for name in ("firmware.bin", "firmware.bin.sig", "kboot.kfpkg"):
+                try:
+                    st = os.stat(os.path.join(root_dir, entry, name))
+                except OSError:
+                    continue
+                stamp.append((entry, name, st.st_size, st.st_mtime_ns))
+        return tuple(stamp)
+
+    @staticmethod
+    def _scan_zip(zip_path: str, version: str) -> dict:
+        prefix = f"krux-{version}/"
+        boards: dict = {}
+        with zipfile.ZipFile(zip_path) as zf:
+            names = set(zf.namelist())
+            for name in sorted(names):
+                parts = name[len(prefix):].split("/") if name.startswith(prefix) else []
+                if len(parts) != 2 or parts[1] != "firmware.bin":
+                    continue
+                digest = hashlib.sha256()
+                with zf.open(name) as member:
+                    for block in iter(lambda: member.read(1024 * 1024), b""):
+                        digest.update(block)
+                boards[parts[0]] = {
+                    "size": zf.getinfo(name).file_size,
+                    "sha256": digest.hexdigest(),
+                    "signature": name + ".sig" in names,
+                    "has_kboot": f"{prefix}{parts[0]}/kboot.kfpkg" in names,
+                }
+        return boards
+
+    @staticmethod
+    def _scan_dir(root_dir: str) -> dict:
+        boards: dict = {}
+        for entry in sorted(os.listdir(root_dir)):
+            fw_path = os.path.join(root_dir, entry, "firmware.bin")
+            if entry.startswith(".") or not os.path.isfile(fw_path):
+                continue
+            kboot_path = os.path.join(root_dir, entry, "kboot.kfpkg")
+            boards[entry] = {
+                "firmware": fw_path,
+                "kboot": kboot_path if os.path.isfile(kboot_path) else None,
+                "size": os.path.getsize(fw_path),
+                "sha256": file_digest(fw_path),
+                "signature": os.path.isfile(fw_path + ".sig"),
+                "verified": krux_cache.verify_firmware(fw_path),
+                "has_kboot": os.path.isfile(kboot_path),
+            }
         return boards
-    for entry in os.listdir(root):
-        board_dir = os.path.join(root, entry)
-        if not os.path.isdir(board_dir):
-            continue
-        fw_path = os.path.join(board_dir, "firmware.bin")
-        if os.path.isfile(fw_path):
-            boards.append({"id": entry, "name": entry, "firmware": fw_path})
-    boards.sort(key=lambda b: b["name"])
-    return boards
+
+    def _cached(self, store: dict, version: str, stamp, scan) -> dict:
+        cached = store.get(version)
+        if cached is None or cached[0] != stamp:
+            cached = (stamp, scan() if stamp is not None else {})
+            store[version] = cached
+        return cached[1]
+
+    def get(self, version: str) -> dict:
+        paths = krux_paths(version)
+        zip_path = os.path.join(self.root, paths["zip_name"])
+        with self._lock:
+            packed = self._cached(self._zip_boards, paths["version"], self._mtime(zip_path), lambda: self._scan_zip(zip_path, paths["version"]))
+            extracted = self._cached(self._dir_boards, paths["version"], self._dir_stamp(paths["root_dir"]), lambda: self._scan_dir(paths["root_dir"]))
+            downloaded = self._zip_boards[paths["version"]][0] is not None
+        boards = {}
+        for board_id in sorted(set(packed) | set(extracted)):
+            entry = {"id": board_id, "name": board_id, "extracted": board_id in extracted, "firmware": None, "kboot": None}
+            entry.update(packed.get(board_id, {}))
+            entry.update(extracted.get(board_id, {}))
+            boards[board_id] = entry
+        return {"version": paths["version"], "downloaded": downloaded, "boards": boards}
+
+    def board(self, version: str, board_id: str) -> Optional[dict]:
+        return self.get(version)["boards"].get(board_id)
+
+    def invalidate(self, version: str) -> None:
+        with self._lock:
+            self._zip_boards.pop(version, None)
+            self._dir_boards.pop(version, None)
+
+
+krux_manifests = KruxManifestIndex(KRUX_CACHE_DIR)
+
+
+def list_krux_boards(version: str) -> List[dict]:
+    """Boards of a release, already extracted or still packed in the downloaded zip."""
+    public = ("id", "name", "extracted", "size", "sha256", "signature", "verified", "has_kboot")
+    return [{k: b.get(k) for k in public} for b in krux_manifests.get(version)["boards"].values()]
+
+
+def krux_flash_images(board_entry: dict, full_install: bool) -> list:
+    """Images to program for a Krux board; a full install adds kboot.kfpkg in the same session."""
+    if not full_install:
+        return [board_entry["firmware"]]
+    kboot = board_entry.get("kboot")
+    if not kboot:
+        raise ValueError("kboot.kfpkg não encontrado para esta placa.")
+    with KfpkgPackage(kboot) as pkg:
+        address = next((f["address"] for f in pkg.files if f["bin"] == "firmware.bin"), None)
+    images: list = [kboot]
+    if address is not None:
+        # firmware.bin of the board replaces the copy packed in kboot.kfpkg
+        images.append((board_entry["firmware"], address))
+    return images
+
+
+class KruxReleaseIndex:
+    """
+    Krux release list persisted on disk and served stale-while-revalidate:
+    get() never waits for the network, a background thread revalidates with
+    If-None-Match and backs off exponentially while GitHub is unreachable.
+    """
+
+    REFRESH_INTERVAL = 300
+    MIN_BACKOFF = 30
+    MAX_BACKOFF = 3600
+
+    def __init__(self, path: str, url: str = KRUX_RELEASES_URL, limit: int = 20):
+        self.path = path
+        self.url = url
+        self.limit = limit
+        self._lock = threading.Lock()
+        self._data: Optional[dict] = None
+        self._refreshing = False
+        self._failures = 0
+        self._next_attempt = 0.0
+        self._listeners: List[Callable[[List[str]], None]] = []
+
+    def _load(self) -> dict:
+        if self._data is None:
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    self._data = json.load(f)
+            except (OSError, ValueError):
+                self._data = {}
+        return self._data
+
+    def _save(self) -> None:
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(self._data, f, indent=1)
+        os.replace(self.path + ".tmp", self.path)
+
+    def add_listener(self, callback: Callable[[List[str]], None]) -> None:
+        """Call callback(versions) whenever a refresh changes the release list."""
+        self._listeners.append(callback)
+
+    def get(self) -> dict:
+        now = time.time()
+        with self._lock:
+            data = dict(self._load())
+            due = now - data.get("checked_at", 0) >= self.REFRESH_INTERVAL and now >= self._next_attempt
+            if due and not self._refreshing:
+                self._refreshing = True
+                threading.Thread(target=self._refresh_background, name="krux-releases", daemon=True).start()
+            refreshing = self._refreshing
+        fetched_at = data.get("fetched_at")
+        return {
+            "versions": (data.get("versions") or KRUX_FALLBACK_VERSIONS)[: self.limit],
+            "source": "cache" if data.get("versions") else "fallback",
+            "fetched_at": fetched_at,
+            "age": now - fetched_at if fetched_at else None,
+            "stale": now - data.get("checked_at", 0) >= self.REFRESH_INTERVAL,
+            "refreshing": refreshing,
+        }
+
+    def refresh(self) -> bool:
+        """Revalidate the list now, return True when it changed."""
+        headers = {"User-Agent": "k210-web-flasher", "Accept": "application/vnd.github+json"}
+        with self._lock:
+            etag = self._load().get("etag")
+        if etag:
+            headers["If-None-Match"] = etag
+        try:
+            with urllib.request.urlopen(urllib.request.Request(self.url, headers=headers), timeout=10) as resp:
+                payload = json.loads(resp.read().decode("utf-8"))
+                etag = resp.headers.get("ETag")
+        except urllib.error.HTTPError as exc:
+            if exc.code != 304:
+                raise
+            with self._lock:
+                self._load()["checked_at"] = time.time()
+                self._save()
+            return False
+        versions = []
+        for item in payload:
+            tag = item.get("tag_name") or item.get("name")
+            if not tag or not tag.startswith("v"):
+                continue
+            versions.append(tag)
+            if len(versions) >= self.limit:
+                break
+        if not versions:
+            raise ValueError("Lista de releases Krux vazia.")
+        now = time.time()
+        with self._lock:
+            data = self._load()
+            changed = versions != data.get("versions")
+            data.update(versions=versions, etag=etag, fetched_at=now, checked_at=now)
+            self._save()
+        if changed:
+            for callback in list(self._listeners):
+                callback(versions)
+        return changed
+
+    def _refresh_background(self) -> None:
+        try:
+            self.refresh()
+            self._failures = 0
+            self._next_attempt = 0.0
+        except Exception as exc:  # noqa: BLE001
+            self._failures += 1
+            delay = min(self.MIN_BACKOFF * 2 ** (self._failures - 1), self.MAX_BACKOFF)
+            self._next_attempt = time.time() + delay
+            print(f"Falha ao atualizar releases Krux ({exc}), nova tentativa em {delay}s")
+        finally:
+            self._refreshing = False
+
+
+krux_releases = KruxReleaseIndex(os.path.join(KRUX_CACHE_DIR, "releases.json"))
 
 
 def fetch_krux_versions(limit: int = 20) -> List[str]:
-    now = time.time()
-    # simple 5-minute cache
-    if _krux_versions_cache["data"] and now - _krux_versions_cache["ts"] < 300:
-        return _krux_versions_cache["data"]
-    url = "https://api.github.com/repos/selfcustody/krux/releases?per_page=50"
-    req = urllib.request.Request(url, headers={"User-Agent": "k210-web-flasher"})
+    return krux_releases.get()["versions"][:limit]
+
+
+def remote_size(url: str) -> Optional[int]:
+    request_obj = urllib.request.Request(url, method="HEAD", headers={"User-Agent": "k210-web-flasher"})
     try:
-        with urllib.request.urlopen(req, timeout=10) as resp:
-            payload = json.loads(resp.read().decode("utf-8"))
-    except Exception:
-        # fallback to a static minimal list if network fails
-        return ["v25.10.1", "v25.09.1", "v25.08.1", "v25.04.1"]
-    versions = []
-    for item in payload:
-        tag = item.get("tag_name") or item.get("name")
-        if not tag:
-            continue
-        if not tag.startswith("v"):
-            continue
-        versions.append(tag)
-        if len(versions) >= limit:
-            break
-    if versions:
-        _krux_versions_cache["data"] = versions
-        _krux_versions_cache["ts"] = now
-    return versions or ["v25.10.1"]
+        with urllib.request.urlopen(request_obj, timeout=DOWNLOAD_TIMEOUT) as resp:
+            length = resp.headers.get("Content-Length")
+    except (urllib.error.URLError, OSError):
+        return None
+    return int(length) if length and length.isdigit() else None
+
+
+class KruxPrefetcher:
+    """
+    Optional background worker (KRUX_PREFETCH=1) that prepares the newest Krux release
+    before anyone asks for it: download and verification, board manifest, extraction of
+    the boards already used on this station and their prepared frames. It runs at low
+    priority, pauses while a flash is running and never evicts cache to make room: a
+    release whose zip and station boards would not fit the quota is skipped.
+    """
+
+    CHECK_INTERVAL = 600
+    PAUSE_INTERVAL = 1.0
+
+    def __init__(self, releases: KruxReleaseIndex, cache: KruxCache, manifests: KruxManifestIndex):
+        self.releases = releases
+        self.cache = cache
+        self.manifests = manifests
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.state: dict = {"state": "disabled"}
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self.state = {"state": "idle"}
+        self.releases.add_listener(lambda versions: self._wake.set())
+        self._thread = threading.Thread(target=self._run, name="krux-prefetch", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        try:
+            # niceness applies to the calling thread only on Linux
+            os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), 19)
+        except (AttributeError, OSError):
+            pass
+        while True:
+            # get() also schedules the background revalidation that wakes us up
+            versions = self.releases.get()["versions"]
+            if versions:
+                try:
+                    self.prefetch(versions[0])
+                except Exception as exc:  # noqa: BLE001
+                    self.state = {"state": "error", "version": versions[0], "error": str(exc)}
+                    print(f"Falha ao pré-carregar Krux {versions[0]}: {exc}")
+            self._wake.wait(self.CHECK_INTERVAL)
+            self._wake.clear()
+
+    def _yield_to_flash(self, flight=None) -> None:
+        # a flash waiting on our download must not wait for us to resume
+        while flash_executor.busy() and not (flight and krux_flights.waiters(flight)):
+            time.sleep(self.PAUSE_INTERVAL)
+
+    def station_boards(self) -> set:
+        """Boards extracted in any cached release, i.e. the ones flashed on this station."""
+        boards: set = set()
+        for version in self.cache.versions():
+            boards.update(b["id"] for b in self.manifests.get(version)["boards"].values() if b["extracted"])
+        return boards
+
+    def station_boards_usage(self) -> int:
+        """Estimate of what extracting the station boards adds, the largest earlier extraction of each."""
+        largest: Dict[str, int] = {}
+        for version in self.cache.versions():
+            for board in self.manifests.get(version)["boards"].values():
+                if board["extracted"]:
+                    size = KruxCache._usage([os.path.dirname(board["firmware"])])
+                    largest[board["id"]] = max(largest.get(board["id"], 0), size)
+        return sum(largest.values())
+
+    def _skip(self, version: str) -> None:
+        self.state = {"state": "skipped", "version": version, "reason": "quota"}
+
+    def prefetch(self, version: str) -> None:
+        paths = krux_paths(version)
+        version = paths["version"]
+        manifest = self.manifests.get(version)
+        if not manifest["downloaded"]:
+            if manifest["boards"]:
+                # zip already evicted, the extracted boards are kept as they are
+                return
+            size = remote_size(paths["url"])
+            quota = self.cache.quota_bytes
+            if quota and (size is None or self.cache.usage() + size + self.station_boards_usage() > quota):
+                self._skip(version)
+                return
+            self._yield_to_flash()
+            self.state = {"state": "downloading", "version": version}
+            download_krux_release(version, throttle=lambda: self._yield_to_flash(("download", version)), evict=False)
+            manifest = self.manifests.get(version)
+        self.state = {"state": "extracting", "version": version}
+        for board_id in sorted(self.station_boards() & set(manifest["boards"])):
+            self._yield_to_flash()
+            if not manifest["boards"][board_id]["extracted"]:
+                quota = self.cache.quota_bytes
+                if quota and self.cache.usage() + krux_board_size(version, board_id) > quota:
+                    self._skip(version)
+                    return
+            extract_krux_board(version, board_id, evict=False)
+            entry = self.manifests.board(version, board_id)
+            if entry and entry["extracted"] and self.cache.verify_firmware(entry["firmware"]):
+                self._yield_to_flash()
+                # same layout kflash builds for a firmware-only flash, cached by digest
+                build_flash_plan([(entry["firmware"], 0, False)])
+        self.state = {"state": "ready", "version": version, "at": time.time()}
+
+
+krux_prefetcher = KruxPrefetcher(krux_releases, krux_cache, krux_manifests)
+
+
+class FlashStats:
+    """
+    Process-wide counters and histograms for /metrics, in the Prometheus text format.
+    Flash sessions are accounted once, from the metrics record kflash builds anyway.
+    """
+
+    DURATION_BUCKETS = (5, 10, 20, 30, 45, 60, 90, 120, 180, 300)
+    PHASE_BUCKETS = (0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+    DOWNLOAD_BUCKETS = (1, 2.5, 5, 10, 30, 60, 120, 300, 600)
+    HELP = {
+        "k210_flashes_total": ("counter", "Flash sessions by board and outcome."),
+        "k210_flash_duration_seconds": ("histogram", "Duration of whole flash sessions."),
+        "k210_flash_phase_duration_seconds": ("histogram", "Duration of flash session phases."),
+        "k210_flash_payload_bytes_total": ("counter", "Image bytes programmed to flash by successful sessions."),
+        "k210_flash_wire_bytes_total": ("counter", "Bytes written to the serial port, SLIP framing included."),
+        "k210_flash_retries_total": ("counter", "Protocol retries by cause."),
+        "k210_greeting_attempts_total": ("counter", "ISP greeting attempts by outcome."),
+        "k210_krux_cache_lookups_total": ("counter", "Krux release cache lookups by result."),
+        "k210_krux_download_duration_seconds": ("histogram", "Duration of Krux release downloads by outcome."),
+    }
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: dict = {}
+        self._histograms: dict = {}
+
+    def inc(self, name: str, labels: tuple = (), value: float = 1) -> None:
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[labels] = series.get(labels, 0) + value
+
+    def observe(self, name: str, value: float, buckets: tuple, labels: tuple = ()) -> None:
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            hist = series.get(labels)
+            if hist is None:
+                hist = series[labels] = {"buckets": buckets, "counts": [0] * len(buckets), "sum": 0.0, "count": 0}
+            for i, bound in enumerate(buckets):
+                if value <= bound:
+                    hist["counts"][i] += 1
+            hist["sum"] += value
+            hist["count"] += 1
+
+    def record_session(self, record: dict) -> None:
+        outcome = "success" if record.get("ok") else "cancelled" if record.get("error") == "Cancel" else "failure"
+        board = record.get("info", {}).get("board") or "unknown"
+        self.inc("k210_flashes_total", (("board", board), ("outcome", outcome)))
+        self.observe("k210_flash_duration_seconds", record["duration"], self.DURATION_BUCKETS, (("outcome", outcome),))
+        for phase in record["phases"]:
+            self.observe("k210_flash_phase_duration_seconds", phase["duration"], self.PHASE_BUCKETS, (("phase", phase["name"]),))
+            if phase["name"] == "greeting":
+                self.inc("k210_greeting_attempts_total", (("outcome", "success" if phase["ok"] else "failure"),))
+        if record.get("ok"):
+            # the images themselves, not the sector padded frames the program phases count
+            self.inc("k210_flash_payload_bytes_total", (), record.get("info", {}).get("image_bytes", 0))
+        self.inc("k210_flash_wire_bytes_total", (), record["bytes"]["wire"])
+        for cause, count in record["retries"].items():
+            self.inc("k210_flash_retries_total", (("cause", cause),), count)
+
+    @staticmethod
+    def _labels(labels: tuple, extra: tuple = ()) -> str:
+        pairs = labels + extra
+        if not pairs:
+            return ""
+        escaped = (str(v).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n") for _, v in pairs)
+        return "{" + ",".join(f'{k}="{v}"' for (k, _), v in zip(pairs, escaped)) + "}"
+
+    def render(self, extra_counters: Optional[dict] = None) -> str:
+        with self._lock:
+            counters = {name: dict(series) for name, series in self._counters.items()}
+            histograms = {name: {k: dict(v, counts=list(v["counts"])) for k, v in series.items()} for name, series in self._histograms.items()}
+        counters.update(extra_counters or {})
+        lines = []
+        for name in self.HELP:
+            kind, text = self.HELP[name]
+            if name not in counters and name not in histograms:
+                continue
+            lines.append(f"# HELP {name} {text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for labels, value in sorted(counters.get(name, {}).items()):
+                lines.append(f"{name}{self._labels(labels)} {value}")
+            for labels, hist in sorted(histograms.get(name, {}).items()):
+                # counts are already cumulative, observe() fills every bucket >= value
+                for bound, count in zip(hist["buckets"], hist["counts"]):
+                    lines.append(f"{name}_bucket{self._labels(labels, (('le', bound),))} {count}")
+                lines.append(f"{name}_bucket{self._labels(labels, (('le', '+Inf'),))} {hist['count']}")
+                lines.append(f"{name}_sum{self._labels(labels)} {hist['sum']}")
+                lines.append(f"{name}_count{self._labels(labels)} {hist['count']}")
+        return "\n".join(lines) + "\n"
+
+
+flash_stats = FlashStats()
+
+
+class TraceStore:
+    """Chrome trace timelines of the last few traced flash jobs, served by /api/flash/trace/<id>."""
+
+    def __init__(self, limit: int = 8):
+        self.limit = limit
+        self._traces: "OrderedDict[str, dict]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def new_id(self) -> str:
+        return uuid.uuid4().hex
+
+    def put(self, trace_id: str, trace: dict) -> None:
+        with self._lock:
+            self._traces[trace_id] = trace
+            while len(self._traces) > self.limit:
+                self._traces.popitem(last=False)
+
+    def get(self, trace_id: str) -> Optional[dict]:
+        with self._lock:
+            return self._traces.get(trace_id)
+
+
+flash_traces = TraceStore()
+
+
+def run_kflash(firmware_path: Union[str, tuple, list, StreamingImage], port: str, board: str, baudrate: int, flash_type: int, sram: bool, noansi: bool, job: "FlashJob", trace_id: Optional[str] = None, profile: bool = False) -> List[str]:
+    kf = KFlash(print_callback=job.log)
+    job.kflash = kf
+    if job.cancel_requested:
+        raise FlashCancelled()
+    try:
+        with KFlash.log_to(job.log):
+            try:
+                kf.process(
+                    terminal=False,
+                    dev=port,
+                    baudrate=baudrate,
+                    board=board or None,
+                    sram=sram,
+                    file=firmware_path,
+                    noansi=noansi,
+                    flash_type=flash_type,
+                    trace=bool(trace_id),
+                    profile=profile,
+                )
+            finally:
+                kf.report_profile()
+    finally:
+        if kf.metrics:
+            flash_stats.record_session(kf.metrics.as_dict())
+        if trace_id and kf.tracer:
+            flash_traces.put(trace_id, kf.tracer.as_dict())
+    return job.output.lines()
+
+
+def async_flash_plan(images: list):
+    """FlashPlan of path, (path, address) and (bytes, address, name) images for the async engine."""
+    specs = []
+    for image in images:
+        source, address, name = (image, None, None) if isinstance(image, str) else (tuple(image) + (None, None))[:3]
+        if isinstance(source, bytes):
+            header = source[:4]
+            source = io.BytesIO(source)
+        else:
+            with open(source, "rb") as f:
+                header = f.read(4)
+            name = name or os.path.basename(source)
+        if header.startswith(b"\x7fELF"):
+            raise Exception(f"{name} é um ELF e não pode ser gravado na flash.")
+        # as in KFlash.process(): a zip is a kfpkg unless its name has another extension,
+        # then it is flashed as a raw image
+        is_kfpkg = header.startswith(b"PK") and (name is None or os.path.splitext(name)[1] == ".kfpkg")
+        specs.append((source, address or 0, is_kfpkg, name or "firmware.bin"))
+    return build_flash_plan(specs)
+
+
+async def run_kflash_async(firmware_path: Union[str, tuple, list], port: str, board: str, baudrate: int, flash_type: int, sram: bool, noansi: bool, job: "FlashJob", trace_id: Optional[str] = None, profile: bool = False) -> List[str]:
+    """run_kflash() on flash_loop with the asyncio protocol engine, progress goes straight to the job log."""
+    images = firmware_path if isinstance(firmware_path, list) else [firmware_path]
+    metrics = SessionMetrics()
+    metrics.tracer = SessionTracer(enabled=bool(trace_id))
+    try:
+        plan = await asyncio.get_event_loop().run_in_executor(None, async_flash_plan, images)
+        await async_flash(port, plan, board=board, baudrate=baudrate, flash_type=flash_type,
+                          metrics=metrics, log=job.log, progress=job.output.progress)
+    finally:
+        flash_stats.record_session(metrics.as_dict())
+        if trace_id:
+            flash_traces.put(trace_id, metrics.tracer.as_dict())
+    return job.output.lines()
+
 
+def async_flash_enabled(options: dict) -> bool:
+    # port auto detection, SRAM loads and the profiler need KFlash.process()
+    return flash_loop is not None and options["port"] != "DEFAULT" and not options["sram"] and not options["profile"]
 
-def run_kflash(firmware_path: str, port: str, board: str, baudrate: int, flash_type: int, sram: bool, noansi: bool) -> List[str]:
-    logs: List[str] = []
 
-    def capture(*args, **kwargs):
+def flash_target(image, options: dict) -> Callable:
+    """Job target flashing image with options, on flash_loop when async_flash_enabled()."""
+    if async_flash_enabled(options):
+        async def target(job: FlashJob) -> None:
+            await run_kflash_async(image, job=job, **options)
+    else:
+        def target(job: FlashJob) -> None:
+            run_kflash(image, job=job, **options)
+    return target
+
+
+FLASH_CANCELLED = "Flash cancelado."
+
+
+def flash_error(exc: Exception) -> str:
+    return FLASH_CANCELLED if isinstance(exc, FlashCancelled) else str(exc)
+
+
+class JobLog:
+    """
+    Log sink of one flash job: entries with a time and a level in a ring buffer of the
+    last `limit` lines. Progress bar redraws update one progress entry per bar instead
+    of adding lines, so memory and responses stay flat however long the job runs.
+    With a path, every finished entry is also appended to that file as a JSON line.
+    """
+
+    ANSI = re.compile(r"\x1b\[[0-9;]*m")
+    PROGRESS = re.compile(r"^(?P<label>.*?):? \|[=-]*\| (?P<percent>[\d.]+)% ?(?P<suffix>.*)$")
+    LEVELS = (("[ERROR]", "error"), ("ERROR:", "error"), ("[WARN]", "warn"), ("[INFO]", "info"))
+
+    def __init__(self, limit: int = JOB_LOG_LINES, path: Optional[str] = None):
+        self.limit = limit
+        self.path = path
+        self._entries: deque = deque(maxlen=limit)
+        self._progress: Dict[str, dict] = {}
+        self._partial = ""
+        self._seq = 0
+        self._lock = threading.Lock()
+
+    def write(self, *args, **kwargs) -> None:
+        """print() compatible, for KFlash.log_to()."""
         sep = kwargs.get("sep", " ")
-        end = kwargs.get("end", "")
-        message = sep.join(str(x) for x in args) + end
-        logs.append(message.strip("\n"))
+        end = kwargs.get("end", "\n")
+        text = self.ANSI.sub("", sep.join(str(x) for x in args))
+        with self._lock:
+            if end == "\r" or text.startswith("\r"):
+                self._update_progress(text.strip("\r"))
+            elif "\n" in end:
+                line, self._partial = (self._partial + text).strip("\n"), ""
+                if line.strip():
+                    self._append(line)
+            else:
+                # greeting dots and other pieces of a line still being written
+                self._partial += text + end
+
+    def _level(self, line: str) -> str:
+        for tag, level in self.LEVELS:
+            if line.startswith(tag):
+                return level
+        return "info"
+
+    def _append(self, line: str, level: Optional[str] = None) -> None:
+        self._seq += 1
+        entry = {"seq": self._seq, "t": round(time.time(), 3), "level": level or self._level(line), "msg": line}
+        self._entries.append(entry)
+        self._spill(entry)
         # Mirror to server stdout for debugging
-        print(message, end="")
+        print(line)
+
+    def _update_progress(self, text: str) -> None:
+        match = self.PROGRESS.match(text)
+        if match:
+            self._set_progress(match.group("label").strip(), float(match.group("percent")), match.group("suffix").strip(), text.strip())
+
+    def progress(self, label: str, percent: float, suffix: str = "") -> None:
+        """Progress event of the async engine, the same entry a redrawn progress bar updates."""
+        with self._lock:
+            self._set_progress(label, round(percent, 1), suffix, f"{label}: {percent:.1f}% {suffix}".strip())
+
+    def _set_progress(self, label: str, percent: float, suffix: str, msg: str) -> None:
+        entry = self._progress.get(label)
+        if entry is None or not self._entries or entry["seq"] < self._entries[0]["seq"] or entry["percent"] > percent:
+            self._seq += 1
+            entry = self._progress[label] = {"seq": self._seq, "level": "progress", "label": label}
+            self._entries.append(entry)
+        entry.update(t=round(time.time(), 3), percent=percent, suffix=suffix, msg=msg)
+        if percent >= 100:
+            self._spill(entry)
+            print(entry["msg"])
+
+    def _spill(self, entry: dict) -> None:
+        if self.path:
+            try:
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write(json.dumps(entry) + "\n")
+            except OSError:
+                pass
+
+    def error(self, message: str) -> None:
+        with self._lock:
+            self._append(message, "error")
+
+    def entries(self) -> List[dict]:
+        with self._lock:
+            return [dict(entry) for entry in self._entries]
+
+    def lines(self) -> List[str]:
+        with self._lock:
+            lines = [entry["msg"] for entry in self._entries]
+            if self._partial.strip():
+                lines.append(self._partial.strip("\n"))
+            return lines
+
+    @property
+    def dropped(self) -> int:
+        with self._lock:
+            return self._entries[0]["seq"] - 1 if self._entries else 0
+
+
+class FlashJob:
+    """One flash request: its own log, state and the KFlash running it, see FlashExecutor."""
+
+    def __init__(self, port: str, target: Callable[["FlashJob"], None], job_id: Optional[str] = None, **info):
+        self.id = job_id or uuid.uuid4().hex
+        self.port = port
+        self.target = target
+        self.info = info
+        self.state = "queued"
+        self.output = JobLog(path=os.path.join(JOB_LOG_DIR, f"{self.id}.jsonl") if JOB_LOG_DIR else None)
+        self.error: Optional[str] = None
+        self.kflash: Optional[KFlash] = None
+        self.task: Optional[asyncio.Future] = None
+        self.cancel_requested = False
+        self.created = time.time()
+        self.started: Optional[float] = None
+        self.finished: Optional[float] = None
+        self.done = threading.Event()
+
+    def log(self, *args, **kwargs) -> None:
+        self.output.write(*args, **kwargs)
+
+    def finish(self, state: str, error: Optional[str] = None) -> None:
+        self.state = state
+        self.error = error
+        if error:
+            self.output.error(f"ERROR: {error}")
+        self.finished = time.time()
+        self.done.set()
+
+    def summary(self) -> dict:
+        return {"job": self.id, "state": self.state, "port": self.port, "created": self.created,
+                "started": self.started, "finished": self.finished, **self.info}
+
+    def as_dict(self) -> dict:
+        return {"success": self.state == "done", "error": self.error, "cancelled": self.state == "cancelled",
+                "log": self.output.lines(), "log_dropped": self.output.dropped, **self.summary()}
+
+
+class FlashQueueFull(Exception):
+    pass
+
+
+class FlashLoop:
+    """One asyncio event loop on a daemon thread, started on first use, shared by every async flash job."""
+
+    def __init__(self):
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock = threading.Lock()
+
+    def get(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(target=self._loop.run_forever, name="flash-loop", daemon=True).start()
+            return self._loop
+
+    def submit(self, coro):
+        """Schedule coro on the loop from any thread, returns a concurrent.futures.Future."""
+        return asyncio.run_coroutine_threadsafe(coro, self.get())
+
+    def call(self, func: Callable, *args) -> None:
+        self.get().call_soon_threadsafe(func, *args)
+
+
+class FlashExecutor:
+    """
+    Runs flash jobs off the request threads: one worker per port with jobs, at most
+    max_workers ports at a time, so a stuck board only holds up its own port.
+    submit() refuses jobs past max_queued waiting in total or max_per_port on a port.
+    An auto detect job may open any board, so it runs alone: it waits for the running
+    jobs to end and no other port starts until the auto detect queue is empty.
+    With a FlashLoop the port workers are tasks on its loop instead of threads: async
+    targets run there, plain ones in the loop's thread pool.
+    """
+
+    AUTO_PORT = "DEFAULT"
+
+    def __init__(self, max_workers: int = 4, max_queued: int = 16, max_per_port: int = 2, history: int = 32,
+                 loop: Optional[FlashLoop] = None):
+        self.loop = loop
+        self.max_workers = max_workers
+        self.max_queued = max_queued
+        self.max_per_port = max_per_port
+        self.history = history
+        self._lock = threading.Lock()
+        self._queues: Dict[str, deque] = {}
+        self._workers: set = set()
+        self._running: Dict[str, FlashJob] = {}
+        self._jobs: "OrderedDict[str, FlashJob]" = OrderedDict()
+
+    def submit(self, job: FlashJob) -> FlashJob:
+        with self._lock:
+            if job.id in self._jobs:
+                raise ValueError("Job já existe.")
+            queued = sum(len(q) for q in self._queues.values())
+            if queued >= self.max_queued:
+                raise FlashQueueFull("Fila de flash cheia, tente novamente em instantes.")
+            if len(self._queues.get(job.port, ())) >= self.max_per_port:
+                raise FlashQueueFull(f"Fila de flash da porta {job.port} cheia.")
+            self._queues.setdefault(job.port, deque()).append(job)
+            self._jobs[job.id] = job
+            self._prune()
+            self._dispatch()
+        return job
+
+    def _prune(self) -> None:
+        finished = [job_id for job_id, job in self._jobs.items() if job.done.is_set()]
+        for job_id in finished[:max(0, len(finished) - self.history)]:
+            del self._jobs[job_id]
+
+    def _dispatch(self) -> None:
+        # with self._lock held
+        if self.AUTO_PORT in self._workers:
+            return
+        if self._queues.get(self.AUTO_PORT):
+            if not self._workers:
+                self._start(self.AUTO_PORT)
+            return
+        for port, queue in self._queues.items():
+            if len(self._workers) >= self.max_workers:
+                break
+            if queue and port not in self._workers:
+                self._start(port)
+
+    def _start(self, port: str) -> None:
+        self._workers.add(port)
+        if self.loop is not None:
+            self.loop.submit(self._work_async(port))
+        else:
+            threading.Thread(target=self._work, args=(port,), name=f"flash-{port}", daemon=True).start()
+
+    def _next(self, port: str) -> Optional[FlashJob]:
+        with self._lock:
+            queue = self._queues.get(port)
+            # a queued auto detect job gets the boards once the running jobs are done
+            if not queue or (port != self.AUTO_PORT and self._queues.get(self.AUTO_PORT)):
+                if not queue:
+                    self._queues.pop(port, None)
+                self._workers.discard(port)
+                self._dispatch()
+                return None
+            job = self._running[port] = queue.popleft()
+            return job
+
+    def _done(self, port: str) -> None:
+        with self._lock:
+            self._running.pop(port, None)
+
+    def _work(self, port: str) -> None:
+        while True:
+            job = self._next(port)
+            if job is None:
+                return
+            self._run(job)
+            self._done(port)
+
+    async def _work_async(self, port: str) -> None:
+        while True:
+            job = self._next(port)
+            if job is None:
+                return
+            await self._run_async(job)
+            self._done(port)
+
+    def _run(self, job: FlashJob) -> None:
+        job.state = "running"
+        job.started = time.time()
+        try:
+            job.target(job)
+        except Exception as exc:  # noqa: BLE001
+            job.finish("cancelled" if isinstance(exc, FlashCancelled) else "failed", flash_error(exc))
+        else:
+            job.finish("done")
+
+    async def _run_async(self, job: FlashJob) -> None:
+        job.state = "running"
+        job.started = time.time()
+        try:
+            if asyncio.iscoroutinefunction(job.target):
+                job.task = asyncio.ensure_future(job.target(job))
+                if job.cancel_requested:
+                    job.task.cancel()
+                await job.task
+            else:
+                await asyncio.get_event_loop().run_in_executor(None, job.target, job)
+        except asyncio.CancelledError:
+            job.finish("cancelled", FLASH_CANCELLED)
+        except Exception as exc:  # noqa: BLE001
+            job.finish("cancelled" if isinstance(exc, FlashCancelled) else "failed", flash_error(exc))
+        else:
+            job.finish("done")
+
+    def get(self, job_id: str) -> Optional[FlashJob]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def cancel(self, job_id: str) -> Optional[FlashJob]:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job.done.is_set():
+                return job
+            queue = self._queues.get(job.port)
+            if queue and job in queue:
+                queue.remove(job)
+                job.finish("cancelled", FLASH_CANCELLED)
+                return job
+            job.cancel_requested = True
+            kf = job.kflash
+            task = job.task
+        if kf is not None:
+            kf.kill()
+        if task is not None:
+            self.loop.call(task.cancel)
+        return job
+
+    def busy(self) -> bool:
+        with self._lock:
+            return bool(self._running)
+
+    def jobs(self) -> List[dict]:
+        with self._lock:
+            return [job.summary() for job in self._jobs.values()]
+
+
+# KFLASH_WEB_ASYNC=1 drives the boards from one event loop with the asyncio protocol engine
+flash_loop = FlashLoop() if parse_bool(os.environ.get("KFLASH_WEB_ASYNC", "false")) else None
+flash_executor = FlashExecutor(
+    max_workers=int(os.environ.get("KFLASH_WEB_WORKERS", "4")),
+    max_queued=int(os.environ.get("KFLASH_WEB_QUEUE", "16")),
+    loop=flash_loop,
+)
+
+
+def parse_flash_options(values) -> dict:
+    """run_kflash options of a flash request from its form or query string, ValueError on a bad baudrate."""
+    port = values.get("port", "auto")
+    try:
+        flash_type = int(values.get("flash", "1"))
+    except ValueError:
+        flash_type = 1
+    if flash_type not in (0, 1):
+        flash_type = 1
+    return {
+        "port": "DEFAULT" if port in ("auto", "", None) else port,
+        "board": values.get("board") or None,
+        "baudrate": int(values.get("baudrate", "1500000")),
+        "flash_type": flash_type,
+        "sram": parse_bool(values.get("sram", "false")),
+        "noansi": parse_bool(values.get("noansi", "true")),
+        "trace_id": flash_traces.new_id() if parse_bool(values.get("trace", "false")) else None,
+        "profile": parse_bool(values.get("profile", "false")),
+    }
+
 
-    KFlash.print_callback = capture
-    kf = KFlash(print_callback=capture)
+def flash_job_id(values) -> Optional[str]:
+    # the page picks the id up front so it can cancel a job whose upload is still running
+    job_id = values.get("job") or ""
+    return job_id if re.fullmatch(r"[0-9a-f]{32}", job_id) else None
+
+
+def enqueue_flash(job: FlashJob):
     try:
-        kf.process(
-            terminal=False,
-            dev=port,
-            baudrate=baudrate,
-            board=board or None,
-            sram=sram,
-            file=firmware_path,
-            noansi=noansi,
-            flash_type=flash_type,
-        )
-    except Exception as exc:  # noqa: BLE001
-        exc._kflash_logs = list(logs)  # type: ignore[attr-defined]
-        raise
-    finally:
-        KFlash.print_callback = None
-    return logs
+        flash_executor.submit(job)
+    except FlashQueueFull as exc:
+        return jsonify({"success": False, "error": str(exc)}), 429
+    except ValueError as exc:
+        return jsonify({"success": False, "error": str(exc)}), 409
+    return jsonify({"success": True, "error": None, **job.summary()}), 202
+
+
+class StaticAsset:
+    """
+    A response body built once at startup, with its gzip (and brotli when available)
+    variants and a content hash ETag, served with a 304 on a matching If-None-Match.
+    """
+
+    def __init__(self, body: bytes, mimetype: str, cache_control: str):
+        self.mimetype = mimetype
+        self.cache_control = cache_control
+        self.etag = hashlib.sha256(body).hexdigest()[:20]
+        self.variants = {"identity": body}
+        compressed = {"gzip": gzip.compress(body, 9, mtime=0)}
+        if brotli is not None:
+            compressed["br"] = brotli.compress(body, quality=11)
+        for encoding, data in compressed.items():
+            if len(data) < len(body):
+                self.variants[encoding] = data
+
+    def pick_encoding(self, accept_encoding: str) -> str:
+        accepted = set()
+        for token in (accept_encoding or "").split(","):
+            name, *params = token.split(";")
+            quality = 1.0
+            for param in params:
+                key, _, value = param.strip().partition("=")
+                if key == "q":
+                    try:
+                        quality = float(value)
+                    except ValueError:
+                        quality = 0.0
+            if quality > 0:
+                accepted.add(name.strip().lower())
+        for encoding in ("br", "gzip"):
+            if encoding in self.variants and (encoding in accepted or "*" in accepted):
+                return encoding
+        return "identity"
+
+    def variant_etag(self, encoding: str) -> str:
+        return f'"{self.etag}"' if encoding == "identity" else f'"{self.etag}-{encoding}"'
+
+    def not_modified(self, if_none_match: str) -> bool:
+        if not if_none_match:
+            return False
+        tags = {tag.strip().replace("W/", "", 1) for tag in if_none_match.split(",")}
+        return "*" in tags or any(self.variant_etag(encoding) in tags for encoding in self.variants)
+
+    def respond(self, accept_encoding: str, if_none_match: str):
+        """(status, headers, body) for a GET with these request headers."""
+        encoding = self.pick_encoding(accept_encoding)
+        headers = {"ETag": self.variant_etag(encoding), "Cache-Control": self.cache_control, "Vary": "Accept-Encoding"}
+        if self.not_modified(if_none_match):
+            return 304, headers, b""
+        if encoding != "identity":
+            headers["Content-Encoding"] = encoding
+        return 200, headers, self.variants[encoding]
+
+    def response(self) -> Response:
+        status, headers, body = self.respond(request.headers.get("Accept-Encoding", ""), request.headers.get("If-None-Match", ""))
+        return Response(body, status=status, headers=headers, mimetype=self.mimetype)
+
+
+def build_ui_assets(page: str) -> Dict[str, StaticAsset]:
+    """
+    Split the page's inline CSS and JS into content addressed assets cached for good,
+    the HTML itself is revalidated on every load and answered with a 304 when unchanged.
+    """
+    immutable = "public, max-age=31536000, immutable"
+    assets: Dict[str, StaticAsset] = {}
+    for tag, ext, mimetype in (("style", "css", "text/css"), ("script", "js", "application/javascript")):
+        start = page.index(f"<{tag}>")
+        end = page.index(f"</{tag}>", start)
+        asset = StaticAsset(page[start + len(tag) + 2:end].encode("utf-8"), mimetype, immutable)
+        name = f"app.{asset.etag}.{ext}"
+        assets[name] = asset
+        if tag == "style":
+            ref = f'<link rel="stylesheet" href="/ui/{name}">'
+        else:
+            ref = f'<script src="/ui/{name}"></script>'
+        page = page[:start] + ref + page[end + len(tag) + 3:]
+    assets["index.html"] = StaticAsset(page.encode("utf-8"), "text/html", "no-cache")
+    return assets
+
+
+UI_ASSETS = build_ui_assets(HOME_PAGE)
 
 
 @app.route("/")
 def index():
-    return render_template_string(HOME_PAGE)
+    return UI_ASSETS["index.html"].response()
+
+
+@app.route("/ui/<name>")
+def ui_asset(name: str):
+    asset = UI_ASSETS.get(name)
+    if asset is None or name == "index.html":
+        return jsonify({"success": False, "error": "Arquivo não encontrado."}), 404
+    return asset.response()
 
 
 @app.route("/api/ports")
@@ -699,66 +2444,143 @@ def api_ports():
     return jsonify({"ports": collect_ports()})
 
 
+@app.route("/api/ports/events")
+def api_ports_events():
+    if not ensure_local_only():
+        return jsonify({"success": False, "error": "Acesso permitido apenas a partir do host local."}), 403
+
+    def stream():
+        version = -1
+        while True:
+            current = port_registry.wait(version, timeout=15)
+            if current == version:
+                yield ": keepalive\n\n"
+                continue
+            version = current
+            yield f"event: ports\ndata: {json.dumps({'ports': port_registry.ports()})}\n\n"
+
+    return Response(stream(), mimetype="text/event-stream", headers={"Cache-Control": "no-cache"})
+
+
 @app.route("/api/flash", methods=["POST"])
 def api_flash():
     if not ensure_local_only():
         return jsonify({"success": False, "error": "Acesso permitido apenas a partir do host local."}), 403
-    if not flash_lock.acquire(blocking=False):
-        return jsonify({"success": False, "error": "Já existe um flash em andamento."}), 409
 
     firmware = request.files.get("firmware")
     if not firmware or firmware.filename == "":
-        flash_lock.release()
         return jsonify({"success": False, "error": "Nenhum arquivo de firmware enviado."}), 400
-
-    port = request.form.get("port", "auto")
-    board = request.form.get("board") or None
-    baudrate = request.form.get("baudrate", "1500000")
     try:
-        flash_type = int(request.form.get("flash", "1"))
+        options = parse_flash_options(request.form)
     except ValueError:
-        flash_type = 1
-    if flash_type not in (0, 1):
-        flash_type = 1
-    sram = parse_bool(request.form.get("sram", "false"))
-    noansi = parse_bool(request.form.get("noansi", "true"))
+        return jsonify({"success": False, "error": "Baudrate inválido."}), 400
 
+    # the spooled upload is gone with the request, the job keeps the bytes; the name
+    # only tells a kfpkg from a zip
+    image = (firmware.read(), None, secure_filename(firmware.filename))
+    job = FlashJob(options["port"], flash_target(image, options),
+                   job_id=flash_job_id(request.form), trace=trace_url(options["trace_id"]))
+    return enqueue_flash(job)
+
+
+@app.route("/api/flash/stream", methods=["POST"])
+def api_flash_stream():
+    # raw .bin body, options in the query string: the greeting starts as soon as the
+    # headers are in and frames are programmed while the rest of the upload arrives,
+    # so this request waits for its job instead of returning it queued
+    if not ensure_local_only():
+        return jsonify({"success": False, "error": "Acesso permitido apenas a partir do host local."}), 403
+    size = request.content_length
+    if not size:
+        return jsonify({"success": False, "error": "Content-Length obrigatório para flash em streaming."}), 411
+    if size > app.config["MAX_CONTENT_LENGTH"]:
+        return jsonify({"success": False, "error": "Firmware grande demais."}), 413
     try:
-        baudrate_val = int(baudrate)
+        options = parse_flash_options(request.args)
     except ValueError:
-        flash_lock.release()
         return jsonify({"success": False, "error": "Baudrate inválido."}), 400
+    options["sram"] = False
+    name = secure_filename(request.args.get("name", "")) or "firmware.bin"
 
-    port_value = "DEFAULT" if port in ("auto", "", None) else port
-
-    tmpdir = tempfile.mkdtemp(prefix="k210_webflash_")
-    firmware_path = os.path.join(tmpdir, secure_filename(firmware.filename))
-    firmware.save(firmware_path)
-
+    image = StreamingImage(request.stream, size, name=name)
+    job = FlashJob(options["port"], lambda job: run_kflash(image, job=job, **options),
+                   job_id=flash_job_id(request.args), trace=trace_url(options["trace_id"]))
     try:
-        logs = run_kflash(
-            firmware_path=firmware_path,
-            port=port_value,
-            board=board,
-            baudrate=baudrate_val,
-            flash_type=flash_type,
-            sram=sram,
-            noansi=noansi,
-        )
-        success = True
-        error = None
-    except Exception as exc:  # noqa: BLE001
-        logs = getattr(exc, "_kflash_logs", [])
-        error = str(exc)
-        success = False
+        response = enqueue_flash(job)
+        if response[1] != 202:
+            return response
+        job.done.wait()
     finally:
-        flash_lock.release()
-        shutil.rmtree(tmpdir, ignore_errors=True)
+        image.close()
+    return jsonify(job.as_dict())
+
+
+@app.route("/api/flash/jobs")
+def api_flash_jobs():
+    if not ensure_local_only():
+        return jsonify({"success": False, "error": "Acesso permitido apenas a partir do host local."}), 403
+    return jsonify({"jobs": flash_executor.jobs()})
+
+
+@app.route("/api/flash/jobs/<job_id>")
+def api_flash_job(job_id: str):
+    if not ensure_local_only():
+        return jsonify({"success": False, "error": "Acesso permitido apenas a partir do host local."}), 403
+    job = flash_executor.get(job_id)
+    if job is None:
+        return jsonify({"success": False, "error": "Job não encontrado."}), 404
+    return jsonify(job.as_dict())
+
 
-    if error:
-        logs.append(f"ERROR: {error}")
+@app.route("/api/flash/jobs/<job_id>/log")
+def api_flash_job_log(job_id: str):
+    # structured entries: time, level and the progress records with their percent
+    if not ensure_local_only():
+        return jsonify({"success": False, "error": "Acesso permitido apenas a partir do host local."}), 403
+    job = flash_executor.get(job_id)
+    if job is None:
+        return jsonify({"success": False, "error": "Job não encontrado."}), 404
+    return jsonify({"success": True, "job": job.id, "state": job.state, "dropped": job.output.dropped,
+                    "entries": job.output.entries()})
 
-    return jsonify({"success": success, "error": error, "log": logs})
+
+@app.route("/api/flash/cancel", methods=["POST"])
+def api_flash_cancel():
+    # a queued job is dropped, a running one wakes from any port wait or sleep within ~50ms
+    if not ensure_local_only():
+        return jsonify({"success": False, "error": "Acesso permitido apenas a partir do host local."}), 403
+    job_id = request.form.get("job") or request.args.get("job")
+    if not job_id:
+        return jsonify({"success": False, "error": "Job não informado."}), 400
+    job = flash_executor.cancel(job_id)
+    if job is None:
+        return jsonify({"success": False, "error": "Job não encontrado."}), 404
+    return jsonify({"success": True, "error": None, **job.summary()})
+
+
+def trace_url(trace_id: Optional[str]) -> Optional[str]:
+    return f"/api/flash/trace/{trace_id}" if trace_id else None
+
+
+@app.route("/api/flash/trace/<trace_id>")
+def api_flash_trace(trace_id: str):
+    # Chrome trace JSON, open it in chrome://tracing or ui.perfetto.dev
+    if not ensure_local_only():
+        return jsonify({"success": False, "error": "Acesso permitido apenas a partir do host local."}), 403
+    trace = flash_traces.get(trace_id)
+    if trace is None:
+        return jsonify({"success": False, "error": "Trace não encontrado."}), 404
+    return Response(json.dumps(trace), mimetype="application/json",
+                    headers={"Content-Disposition": f"attachment; filename=kflash-trace-{trace_id[:8]}.json"})
+
+
+@app.route("/metrics")
+def api_metrics():
+    if not ensure_local_only():
+        return jsonify({"success": False, "error": "Acesso permitido apenas a partir do host local."}), 403
+    hits, misses = krux_cache.lookups()
+    lookups = {"k210_krux_cache_lookups_total": {(("result", "hit"),): hits, (("result", "miss"),): misses}}
+    return Response(flash_stats.render(lookups), mimetype="text/plain; version=0.0.4")
 
 
 @app.route("/api/krux/status")
@@ -770,10 +2592,10 @@ def api_krux_status():
         paths = krux_paths(version)
     except ValueError as exc:
         return jsonify({"success": False, "error": str(exc)})
-    zip_path = os.path.join(KRUX_CACHE_DIR, paths["zip_name"])
-    downloaded = os.path.exists(zip_path)
-    extracted = bool(get_krux_root_dir(version))
-    boards = list_krux_boards(version) if extracted else []
+    manifest = krux_manifests.get(version)
+    downloaded = manifest["downloaded"]
+    boards = list_krux_boards(version)
+    extracted = bool(boards)
     return jsonify({"success": True, "version": paths["version"], "downloaded": downloaded, "extracted": extracted, "boards": boards})
 
 
@@ -781,95 +2603,114 @@ def api_krux_status():
 def api_krux_releases():
     if not ensure_local_only():
         return jsonify({"success": False, "error": "Acesso permitido apenas a partir do host local."}), 403
-    versions = fetch_krux_versions()
-    return jsonify({"success": True, "versions": versions})
+    return jsonify({"success": True, **krux_releases.get()})
+
+
+@app.route("/api/krux/cache")
+def api_krux_cache():
+    if not ensure_local_only():
+        return jsonify({"success": False, "error": "Acesso permitido apenas a partir do host local."}), 403
+    return jsonify({"success": True, **krux_cache.status(), "prefetch": krux_prefetcher.state})
+
+
+@app.route("/api/krux/download/progress")
+def api_krux_download_progress():
+    if not ensure_local_only():
+        return jsonify({"success": False, "error": "Acesso permitido apenas a partir do host local."}), 403
+    try:
+        paths = krux_paths(request.args.get("version", "v25.10.1"))
+    except ValueError as exc:
+        return jsonify({"success": False, "error": str(exc)})
+    state = dict(_krux_download_progress.get(paths["version"], {"state": "idle"}))
+    return jsonify({"success": True, "version": paths["version"], **state})
 
 
 @app.route("/api/krux/download", methods=["POST"])
 def api_krux_download():
     if not ensure_local_only():
         return jsonify({"success": False, "error": "Acesso permitido apenas a partir do host local."}), 403
-    if not _krux_lock.acquire(blocking=False):
-        return jsonify({"success": False, "error": "Download já em andamento."}), 409
     version = request.form.get("version", "v25.10.1")
     try:
+        paths = krux_paths(version)
+        cache_hit = os.path.exists(os.path.join(KRUX_CACHE_DIR, paths["zip_name"]))
         result = download_krux_release(version=version, force=False)
+        krux_cache.record(paths["version"], cache_hit)
         boards = list_krux_boards(version)
         return jsonify({"success": True, "version": result["version"], "boards": boards})
     except Exception as exc:  # noqa: BLE001
         return jsonify({"success": False, "error": str(exc)})
-    finally:
-        _krux_lock.release()
 
 
 @app.route("/api/flash-krux", methods=["POST"])
 def api_flash_krux():
     if not ensure_local_only():
         return jsonify({"success": False, "error": "Acesso permitido apenas a partir do host local."}), 403
-    if not flash_lock.acquire(blocking=False):
-        return jsonify({"success": False, "error": "Já existe um flash em andamento."}), 409
 
     version = request.form.get("version", "v25.10.1")
     board_id = request.form.get("krux_board")
     if not board_id:
-        flash_lock.release()
         return jsonify({"success": False, "error": "Nenhuma placa Krux selecionada."}), 400
-
-    try:
-        download_krux_release(version=version, force=False)
-    except Exception as exc:  # noqa: BLE001
-        flash_lock.release()
-        return jsonify({"success": False, "error": f"Falha ao baixar release Krux: {exc}"}), 500
-
-    board_entry: Optional[dict] = next((b for b in list_krux_boards(version) if b["id"] == board_id), None)
-    if not board_entry:
-        flash_lock.release()
-        return jsonify({"success": False, "error": "Placa Krux não encontrada na release baixada."}), 404
-
-    port = request.form.get("port", "auto")
-    kboard = request.form.get("board") or None
-    baudrate = request.form.get("baudrate", "1500000")
+    if not re.fullmatch(r"[\w.-]+", board_id) or board_id in (".", ".."):
+        return jsonify({"success": False, "error": "Placa Krux inválida."}), 400
     try:
-        baudrate_val = int(baudrate)
+        options = parse_flash_options(request.form)
     except ValueError:
-        flash_lock.release()
         return jsonify({"success": False, "error": "Baudrate inválido."}), 400
-
+    full_install = request.form.get("krux_image", "firmware") == "full"
     try:
-        flash_type = int(request.form.get("flash", "1"))
-    except ValueError:
-        flash_type = 1
-    if flash_type not in (0, 1):
-        flash_type = 1
-    sram = parse_bool(request.form.get("sram", "false"))
-    noansi = parse_bool(request.form.get("noansi", "true"))
-
-    port_value = "DEFAULT" if port in ("auto", "", None) else port
-
-    logs: List[str] = []
-    error = None
-    try:
-        logs = run_kflash(
-            firmware_path=board_entry["firmware"],
-            port=port_value,
-            board=kboard,
-            baudrate=baudrate_val,
-            flash_type=flash_type,
-            sram=sram,
-            noansi=noansi,
-        )
-        success = True
-    except Exception as exc:  # noqa: BLE001
-        logs = getattr(exc, "_kflash_logs", []) if hasattr(exc, "_kflash_logs") else logs
-        error = str(exc)
-        success = False
-    finally:
-        flash_lock.release()
-
-    if error:
-        logs.append(f"ERROR: {error}")
-
-    return jsonify({"success": success, "error": error, "log": logs, "krux_board": board_id, "version": version})
+        release = krux_paths(version)["version"]
+    except ValueError as exc:
+        return jsonify({"success": False, "error": str(exc)}), 400
+
+    def krux_images(job: FlashJob) -> list:
+        # download, extraction and the signature check run in the job, not the request
+        try:
+            paths = krux_paths(version)
+            manifest = krux_manifests.get(version)
+            cache_hit = board_id in manifest["boards"] or manifest["downloaded"]
+            if not cache_hit:
+                job.log("Baixando release Krux", version)
+                download_krux_release(version=version, force=False)
+            krux_cache.record(paths["version"], cache_hit)
+        except Exception as exc:  # noqa: BLE001
+            raise Exception(f"Falha ao baixar release Krux: {exc}") from exc
+
+        board_entry = krux_manifests.board(version, board_id)
+        if not board_entry:
+            raise Exception("Placa Krux não encontrada na release baixada.")
+        if not board_entry["extracted"]:
+            try:
+                extract_krux_board(version, board_id)
+                board_entry = krux_manifests.board(version, board_id)
+            except Exception as exc:  # noqa: BLE001
+                raise Exception(f"Falha ao extrair placa Krux: {exc}") from exc
+        # recorded at extraction time, this is a stat() unless the files changed since
+        verified = krux_cache.verify_firmware(board_entry["firmware"])
+        if verified is None:
+            raise Exception("Firmware Krux sem assinatura (firmware.bin.sig), flash recusado.")
+        if verified is not True:
+            raise Exception("Assinatura do firmware Krux inválida, flash recusado.")
+
+        return krux_flash_images(board_entry, full_install)
+
+    # pinned from before the download until the flash ends, a job on another port
+    # that enforces the quota must not evict the release in between
+    def flash_krux(job: FlashJob) -> None:
+        with krux_cache.pin(release):
+            images = krux_images(job)
+            run_kflash(images, job=job, **options)
+        krux_cache.touch(release)
+
+    async def flash_krux_async(job: FlashJob) -> None:
+        with krux_cache.pin(release):
+            images = await asyncio.get_event_loop().run_in_executor(None, krux_images, job)
+            await run_kflash_async(images, job=job, **options)
+        krux_cache.touch(release)
+
+    target = flash_krux_async if async_flash_enabled(options) else flash_krux
+    job = FlashJob(options["port"], target, job_id=flash_job_id(request.form),
+                   krux_board=board_id, version=version, trace=trace_url(options["trace_id"]))
+    return enqueue_flash(job)
 
 
 if __name__ == "__main__":
@@ -877,6 +2718,8 @@ if __name__ == "__main__":
     host = "127.0.0.1"
     url = f"http://{host}:{port}"
     print(f"\nK210 Web Flasher ouvindo em {url} (Ctrl+C para sair)")
+    if parse_bool(os.environ.get("KRUX_PREFETCH", "false")):
+        krux_prefetcher.start()
     try:
         webbrowser.open(url)
     except Exception: